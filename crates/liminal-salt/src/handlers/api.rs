@@ -4,17 +4,23 @@
 //! because these are essentially data-dictionary endpoints with no state
 //! changes beyond the theme write.
 
+use std::sync::Arc;
+
 use axum::{
     Form, Json,
     extract::State,
-    http::StatusCode,
+    http::{StatusCode, header},
     response::{IntoResponse, Response},
 };
 use serde::Deserialize;
 
 use crate::{
     AppState,
-    services::{config, providers, themes},
+    services::{
+        config,
+        providers::{self, openrouter::ModelList},
+        themes,
+    },
 };
 
 // =============================================================================
@@ -73,21 +79,13 @@ pub async fn save_theme(
 
 pub async fn available_models(State(state): State<AppState>) -> Response {
     let cfg = config::load_config(&state.data_dir).await;
-    if cfg.api_key.is_empty() {
-        return (
-            StatusCode::BAD_REQUEST,
-            Json(serde_json::json!({"error": "No API key configured"})),
-        )
-            .into_response();
-    }
-    let Some(provider) = providers::by_id(&cfg.provider) else {
-        return (
-            StatusCode::BAD_REQUEST,
-            Json(serde_json::json!({"error": "Unknown provider"})),
-        )
-            .into_response();
+    let models = match configured_models(&state, &cfg, false).await {
+        Ok(m) => m,
+        Err(msg) => {
+            return (StatusCode::BAD_REQUEST, Json(serde_json::json!({"error": msg})))
+                .into_response();
+        }
     };
-    let models = provider.list_models(&state.http, &cfg.api_key).await;
     if models.is_empty() {
         return (
             StatusCode::INTERNAL_SERVER_ERROR,
@@ -95,5 +93,32 @@ pub async fn available_models(State(state): State<AppState>) -> Response {
         )
             .into_response();
     }
-    Json(serde_json::json!({"models": models})).into_response()
+    // The list's JSON is cached with it — splice rather than re-serialize.
+    (
+        [(header::CONTENT_TYPE, "application/json")],
+        format!(r#"{{"models":{}}}"#, models.json),
+    )
+        .into_response()
+}
+
+/// Model list for the provider + key saved in config, shared by this endpoint
+/// and setup step 2 so both hit the provider's cached catalog. A missing or
+/// unrecognized provider is an error unless `fallback_to_openrouter` is set
+/// (the wizard, where OpenRouter is the default). `Err` carries the
+/// user-facing reason nothing was fetched; an empty list means the fetch
+/// itself failed.
+pub(crate) async fn configured_models(
+    state: &AppState,
+    cfg: &config::AppConfig,
+    fallback_to_openrouter: bool,
+) -> Result<Arc<ModelList>, &'static str> {
+    if cfg.api_key.is_empty() {
+        return Err("No API key configured");
+    }
+    let provider = match providers::by_id(&cfg.provider) {
+        Some(p) => p,
+        None if fallback_to_openrouter => providers::Provider::OpenRouter,
+        None => return Err("Unknown provider"),
+    };
+    Ok(provider.list_models(&state.http, &cfg.api_key).await)
 }
@@ -1,8 +1,11 @@
 //! Chat-flow HTTP handlers. Thin: parse → call service → render → return.
 //! All file I/O goes through `services::session`; all LLM calls go through
-//! `services::chat` / `services::summarizer`.
+//! `services::chat` (which also drives `services::summarizer`).
 
-use std::collections::BTreeMap;
+use std::{
+    collections::{BTreeMap, HashMap},
+    hash::Hash,
+};
 
 use axum::{
     Form,
@@ -16,13 +19,14 @@ use tower_sessions::Session;
 
 use crate::{
     AppState,
+    handlers::revalidate,
     middleware::session_state,
     services::{
-        chat as chat_svc, config, persona as persona_svc, prompt, providers,
-        session as session_svc, summarizer, thread_memory,
+        chat as chat_svc, config, fs, persona as persona_svc, prompt, providers,
+        session as session_svc, thread_memory,
     },
 };
-use crate::services::session::{Mode, SessionError, SessionSummary};
+use crate::services::session::{Mode, Role, Session as SessionData, SessionError, SessionSummary};
 
 // =============================================================================
 // Helpers
@@ -43,44 +47,48 @@ pub struct PersonaGroup {
 
 /// Partition sessions into pinned + persona-grouped. Persona groups are
 /// ordered by most-recent-session-id descending, matching Python's sidebar
-/// ordering. Each group is already newest-first because `list_sessions` sorts
-/// by id desc.
+/// ordering. `list_sessions` sorts by id desc, so each group is already
+/// newest-first and groups come out in that order simply by opening them on
+/// first sight — one pass, no sort.
 pub(crate) fn group_sessions(
     sessions: Vec<SessionSummary>,
 ) -> (Vec<SessionSummary>, Vec<PersonaGroup>) {
     let mut pinned = Vec::new();
-    let mut buckets: BTreeMap<String, Vec<SessionSummary>> = BTreeMap::new();
+    let mut groups: Vec<PersonaGroup> = Vec::new();
+    let mut index: HashMap<String, usize> = HashMap::new();
     for s in sessions {
         if s.pinned {
             pinned.push(s);
-        } else {
-            buckets.entry(s.persona.clone()).or_default().push(s);
+            continue;
+        }
+        match index.get(&s.persona) {
+            Some(&i) => groups[i].sessions.push(s),
+            None => {
+                index.insert(s.persona.clone(), groups.len());
+                groups.push(PersonaGroup {
+                    persona: s.persona.clone(),
+                    sessions: vec![s],
+                });
+            }
         }
     }
-    let mut groups: Vec<PersonaGroup> = buckets
-        .into_iter()
-        .map(|(persona, sessions)| PersonaGroup { persona, sessions })
-        .collect();
-    groups.sort_by(|a, b| {
-        b.sessions
-            .first()
-            .map(|s| s.id.as_str())
-            .unwrap_or("")
-            .cmp(a.sessions.first().map(|s| s.id.as_str()).unwrap_or(""))
-    });
     (pinned, groups)
 }
 
 /// Build a Context seeded with fields every chat template expects: csrf token,
-/// theme, sidebar session groups, current session highlight.
-pub(crate) async fn base_chat_context(state: &AppState, session: &Session) -> Context {
+/// theme, sidebar session groups, current session highlight. Takes the
+/// caller's already-loaded config so a render reads it once.
+pub(crate) async fn base_chat_context(
+    state: &AppState,
+    session: &Session,
+    cfg: &config::AppConfig,
+) -> Context {
     let mut ctx = Context::new();
     ctx.insert(
         "csrf_token",
         &session_state::current_csrf_token(session).await,
     );
 
-    let cfg = config::load_config(&state.data_dir).await;
     let theme = if cfg.theme.is_empty() {
         "liminal-salt".to_string()
     } else {
@@ -114,15 +122,25 @@ pub(crate) async fn base_chat_context(state: &AppState, session: &Session) -> Co
 /// `chat/chat_home.html` (HTMX partial) depending on the request.
 async fn render_view(state: &AppState, session: &Session, headers: &HeaderMap) -> Response {
     let current_id = session_state::current_session_id(session).await;
-    let mut ctx = base_chat_context(state, session).await;
-
-    let cfg = config::load_config(&state.data_dir).await;
-
     // Load the current session if present & valid, else render home.
     let session_data = match &current_id {
         Some(id) => session_svc::load_session(&state.sessions_dir, id).await.ok(),
         None => None,
     };
+    render_loaded_view(state, session, headers, current_id, session_data).await
+}
+
+/// `render_view` for a caller that already resolved and loaded the current
+/// session.
+async fn render_loaded_view(
+    state: &AppState,
+    session: &Session,
+    headers: &HeaderMap,
+    current_id: Option<String>,
+    session_data: Option<SessionData>,
+) -> Response {
+    let cfg = config::load_config(&state.data_dir).await;
+    let mut ctx = base_chat_context(state, session, &cfg).await;
 
     let show_home = session_data.is_none();
     ctx.insert("show_home", &show_home);
@@ -265,12 +283,64 @@ async fn persist_timezone(session: &Session, tz: Option<&str>) {
 // Handlers
 // =============================================================================
 
+/// GET /chat/. A thread view carries a weak ETag built from the stamps of
+/// everything it renders; HTMX navigations back to an unchanged thread get a
+/// 304 instead of a sidebar listing, markdown pass and template render.
 pub async fn view(
     State(state): State<AppState>,
     session: Session,
     headers: HeaderMap,
 ) -> Response {
-    render_view(&state, &session, &headers).await
+    let current_id = session_state::current_session_id(&session).await;
+    let session_data = match &current_id {
+        Some(id) => session_svc::load_session(&state.sessions_dir, id).await.ok(),
+        None => None,
+    };
+    let etag = match (&current_id, &session_data) {
+        (Some(id), Some(data)) => Some(thread_view_etag(&state, &session, &headers, id, data).await),
+        // Home renders the persona picker; not worth tracking its inputs.
+        _ => None,
+    };
+    if let Some(tag) = &etag
+        && revalidate::etag_matches(&headers, tag)
+    {
+        return revalidate::not_modified(tag);
+    }
+
+    let mut resp = render_loaded_view(&state, &session, &headers, current_id, session_data).await;
+    if let Some(tag) = &etag
+        && resp.status().is_success()
+    {
+        revalidate::set_revalidation_headers(&mut resp, tag);
+    }
+    resp
+}
+
+/// Hash of every input a thread view depends on: the session file, the
+/// sidebar listing itself (served from the summary cache, and the directory
+/// mtime can't vouch for in-place rewrites), config.json, the persona's
+/// config, plus the CSRF token and HTMX flag embedded in / selecting the
+/// markup.
+async fn thread_view_etag(
+    state: &AppState,
+    session: &Session,
+    headers: &HeaderMap,
+    session_id: &str,
+    data: &SessionData,
+) -> String {
+    let mut h = revalidate::etag_hasher();
+    session_id.hash(&mut h);
+    is_htmx(headers).hash(&mut h);
+    session_state::current_csrf_token(session).await.hash(&mut h);
+    session_svc::list_sessions(&state.sessions_dir).await.hash(&mut h);
+    for path in [
+        state.sessions_dir.join(session_id),
+        config::config_file(&state.data_dir),
+        persona_svc::config_file(&state.data_dir, &data.persona),
+    ] {
+        fs::stat_stamp(&path).await.hash(&mut h);
+    }
+    revalidate::weak_etag(h)
 }
 
 pub async fn new_chat(
@@ -293,10 +363,20 @@ pub async fn switch(
     headers: HeaderMap,
     Form(form): Form<SwitchForm>,
 ) -> Response {
-    if session_svc::valid_session_id(&form.session_id) {
-        session_state::set_current_session_id(&session, Some(&form.session_id)).await;
+    if !session_svc::valid_session_id(&form.session_id) {
+        return render_view(&state, &session, &headers).await;
     }
-    render_view(&state, &session, &headers).await
+    // The target id is already known, so load it alongside the session-state
+    // write instead of reading the id back out and loading afterwards.
+    let ((), session_data) = tokio::join!(
+        session_state::set_current_session_id(&session, Some(&form.session_id)),
+        async {
+            session_svc::load_session(&state.sessions_dir, &form.session_id)
+                .await
+                .ok()
+        },
+    );
+    render_loaded_view(&state, &session, &headers, Some(form.session_id), session_data).await
 }
 
 #[derive(Deserialize)]
@@ -326,9 +406,9 @@ pub async fn start_chat(
     };
 
     // Create session with the user's initial message pre-saved.
-    let id = session_svc::generate_session_id();
+    let id = session_svc::generate_session_id(&state.sessions_dir).await;
     let initial_messages = vec![session_svc::Message {
-        role: crate::services::session::Role::User,
+        role: Role::User,
         content: form.message.clone(),
         timestamp: session_svc::now_timestamp(),
     }];
@@ -359,7 +439,8 @@ pub async fn start_chat(
     // Render the main chat view with `pending_message` — the template fires an
     // HTMX `hx-trigger="load"` POST to /chat/send/ so the user sees the
     // thinking indicator while the LLM responds.
-    let mut ctx = base_chat_context(&state, &session).await;
+    let cfg = config::load_config(&state.data_dir).await;
+    let mut ctx = base_chat_context(&state, &session, &cfg).await;
     ctx.insert("session_id", &id);
     ctx.insert("title", "New Chat");
     ctx.insert("persona", &form.persona);
@@ -422,7 +503,13 @@ pub async fn send(
         return (StatusCode::BAD_REQUEST, "no current session").into_response();
     };
 
-    let existing = match session_svc::load_session(&state.sessions_dir, &session_id).await {
+    // The session file and config.json are independent reads; overlap them,
+    // then overlap everything that only needs the loaded session's persona.
+    let (loaded, cfg) = tokio::join!(
+        session_svc::load_session(&state.sessions_dir, &session_id),
+        config::load_config(&state.data_dir),
+    );
+    let existing = match loaded {
         Ok(s) => s,
         Err(SessionError::NotFound(_) | SessionError::InvalidId(_)) => {
             return (StatusCode::NOT_FOUND, "session not found").into_response();
@@ -433,12 +520,15 @@ pub async fn send(
         }
     };
 
-    let cfg = config::load_config(&state.data_dir).await;
     let Some(provider) = providers::by_id(&cfg.provider) else {
         tracing::error!(provider = %cfg.provider, "unknown provider in config");
         return (StatusCode::INTERNAL_SERVER_ERROR, "unknown provider").into_response();
     };
-    let persona_cfg = persona_svc::load_persona_config(&state.data_dir, &existing.persona).await;
+    let (persona_cfg, system_prompt, user_tz) = tokio::join!(
+        persona_svc::load_persona_config(&state.data_dir, &existing.persona),
+        prompt::build_system_prompt(&state.data_dir, &existing),
+        session_state::user_timezone(&session),
+    );
     let effective_model = persona_cfg
         .model
         .as_deref()
@@ -446,66 +536,22 @@ pub async fn send(
         .unwrap_or(&cfg.model);
     let llm = provider.build_chat_llm(&state.http, &cfg.api_key, effective_model);
 
-    let system_prompt = prompt::build_system_prompt(&state.data_dir, &existing).await;
-
-    let user_tz = session_state::user_timezone(&session).await;
-    let history_limit = if cfg.context_history_limit == 0 {
-        50
-    } else {
-        cfg.context_history_limit as usize
-    };
     let ctx_out = chat_svc::SendContext {
         sessions_dir: &state.sessions_dir,
         session_id: &session_id,
         system_prompt: &system_prompt,
         user_timezone: &user_tz,
         assistant_timezone: None,
-        context_history_limit: history_limit,
+        context_history_limit: cfg.context_history_limit as usize,
+        auto_title: true,
+        clear_draft: true,
     };
 
     let skip = form.skip_user_save == "true" || form.skip_user_save == "1";
-    let outcome = chat_svc::send_message(&ctx_out, &llm, &form.message, skip).await;
-
-    // After-the-fact: if the session still has no title_locked and the turn
-    // succeeded, generate one. Read the session fresh to avoid TOCTOU on the
-    // just-persisted messages.
-    let mut title_changed: Option<String> = None;
-    if outcome.is_ok()
-        && let Ok(post) = session_svc::load_session(&state.sessions_dir, &session_id).await
-        && !post.title_locked.unwrap_or(false)
-    {
-        // Use the first user + first assistant message for the summary prompt.
-        let first_user = post
-            .messages
-            .iter()
-            .find(|m| matches!(m.role, crate::services::session::Role::User))
-            .map(|m| m.content.clone())
-            .unwrap_or_default();
-        let first_assistant = post
-            .messages
-            .iter()
-            .find(|m| matches!(m.role, crate::services::session::Role::Assistant))
-            .map(|m| m.content.clone())
-            .unwrap_or_default();
-
-        if !first_user.is_empty() && !first_assistant.is_empty() {
-            let title = summarizer::generate_title(&llm, &first_user, &first_assistant).await;
-            // Persist with title_locked=true so this runs exactly once.
-            if let Err(err) = session_svc::save_chat_history(
-                &state.sessions_dir,
-                &session_id,
-                &title,
-                &post.persona,
-                post.messages,
-                Some(true),
-            )
-            .await
-            {
-                tracing::warn!(session_id = %session_id, error = %err, "title save failed");
-            }
-            title_changed = Some(title);
-        }
-    }
+    // `existing` was loaded above for the prompt; hand it over rather than
+    // having the service re-read the file.
+    let outcome =
+        chat_svc::send_message_with_session(&ctx_out, &llm, existing, &form.message, skip).await;
 
     // Render the assistant_fragment partial — HTMX appends this to
     // #messages-inner (hx-swap="beforeend").
@@ -515,7 +561,7 @@ pub async fn send(
         &session_state::current_csrf_token(&session).await,
     );
     match &outcome {
-        Ok(text) => ctx.insert("assistant_message", text),
+        Ok(sent) => ctx.insert("assistant_message", &sent.reply),
         Err(err) => ctx.insert("error_message", &err.to_string()),
     }
     ctx.insert("assistant_timestamp", &session_svc::now_timestamp());
@@ -529,8 +575,8 @@ pub async fn send(
     };
 
     let mut response = Html(body).into_response();
-    if let Some(title) = title_changed {
-        if let Ok(v) = HeaderValue::from_str(&title) {
+    if let Some(title) = outcome.as_ref().ok().and_then(|sent| sent.title.as_deref()) {
+        if let Ok(v) = HeaderValue::from_str(title) {
             response.headers_mut().insert("X-Chat-Title", v);
         }
         if let Ok(v) = HeaderValue::from_str(&session_id) {
@@ -688,3 +734,39 @@ pub async fn edit_message(
         (StatusCode::BAD_REQUEST, "edit failed").into_response()
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn summary(id: &str, persona: &str, pinned: bool) -> SessionSummary {
+        SessionSummary {
+            id: id.to_string(),
+            title: String::new(),
+            persona: persona.to_string(),
+            pinned,
+            mode: Mode::Chatbot,
+        }
+    }
+
+    #[test]
+    fn group_sessions_orders_groups_by_newest_thread() {
+        // Newest-first, as list_sessions returns them.
+        let sessions = vec![
+            summary("session_20260421_120005.json", "b", false),
+            summary("session_20260421_120004.json", "a", true),
+            summary("session_20260421_120003.json", "a", false),
+            summary("session_20260421_120002.json", "b", false),
+            summary("session_20260421_120001.json", "c", false),
+        ];
+        let (pinned, groups) = group_sessions(sessions);
+        assert_eq!(pinned.len(), 1);
+        assert_eq!(pinned[0].id, "session_20260421_120004.json");
+        let order: Vec<(&str, usize)> = groups
+            .iter()
+            .map(|g| (g.persona.as_str(), g.sessions.len()))
+            .collect();
+        assert_eq!(order, vec![("b", 2), ("a", 1), ("c", 1)]);
+        assert_eq!(groups[0].sessions[1].id, "session_20260421_120002.json");
+    }
+}
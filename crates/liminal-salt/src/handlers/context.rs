@@ -17,7 +17,7 @@ use crate::{
     AppState,
     handlers::status::context_scope_status,
     services::{
-        context_files::{ContextScope, ContextScopeError},
+        context_files::{ContextFileEntry, ContextScope, ContextScopeError, LocalDirectoryEntry},
         local_context::{self, ReadError},
     },
 };
@@ -96,17 +96,30 @@ async fn upload_impl(
 
 #[derive(Serialize)]
 struct FilesResponse {
-    files: Vec<crate::services::context_files::ContextFileEntry>,
+    files: Vec<ContextFileEntry>,
 }
 
-async fn mutate_file_impl<F, Fut>(
+/// Toggle response — just the entry that changed. The client already holds
+/// the list and patches it in place, so there's no need to re-scan the dir.
+#[derive(Serialize)]
+struct FileDeltaResponse {
+    file: ContextFileEntry,
+}
+
+#[derive(Serialize)]
+struct DeletedResponse {
+    deleted: String,
+}
+
+async fn mutate_file_impl<F, Fut, T>(
     state: AppState,
     mut multipart: Multipart,
     op: F,
 ) -> Response
 where
     F: FnOnce(ContextScope, String) -> Fut,
-    Fut: std::future::Future<Output = Result<(), ContextScopeError>>,
+    Fut: std::future::Future<Output = Result<T, ContextScopeError>>,
+    T: Serialize,
 {
     let mut persona = String::new();
     let mut filename: Option<String> = None;
@@ -121,16 +134,13 @@ where
         return (StatusCode::BAD_REQUEST, "filename required").into_response();
     };
     let scope = scope_for(&state, &persona);
-    if let Err(err) = op(scope, fname.clone()).await {
-        tracing::warn!(persona = %persona, filename = %fname, error = %err, "context file op failed");
-        return (context_scope_status(&err), "operation failed").into_response();
+    match op(scope, fname.clone()).await {
+        Ok(body) => Json(body).into_response(),
+        Err(err) => {
+            tracing::warn!(persona = %persona, filename = %fname, error = %err, "context file op failed");
+            (context_scope_status(&err), "operation failed").into_response()
+        }
     }
-    // Re-list and return.
-    let scope = scope_for(&state, &persona);
-    Json(FilesResponse {
-        files: scope.list_files().await,
-    })
-    .into_response()
 }
 
 pub async fn toggle_file_global(
@@ -138,7 +148,10 @@ pub async fn toggle_file_global(
     multipart: Multipart,
 ) -> Response {
     mutate_file_impl(state, multipart, |scope, name| async move {
-        scope.toggle_file(&name, None).await.map(|_| ())
+        let enabled = scope.toggle_file(&name, None).await?;
+        Ok(FileDeltaResponse {
+            file: ContextFileEntry { name, enabled },
+        })
     })
     .await
 }
@@ -155,7 +168,8 @@ pub async fn delete_file_global(
     multipart: Multipart,
 ) -> Response {
     mutate_file_impl(state, multipart, |scope, name| async move {
-        scope.delete_file(&name).await
+        scope.delete_file(&name).await?;
+        Ok(DeletedResponse { deleted: name })
     })
     .await
 }
@@ -226,7 +240,7 @@ pub async fn save_file_content(
 
 #[derive(Serialize)]
 struct DirectoriesResponse {
-    directories: Vec<crate::services::context_files::LocalDirectoryEntry>,
+    directories: Vec<LocalDirectoryEntry>,
 }
 
 #[derive(Deserialize)]
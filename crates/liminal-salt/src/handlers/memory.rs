@@ -2,6 +2,8 @@
 //! seed/save-settings/status). All LLM work is dispatched to `MemoryWorker`;
 //! this module only shapes the HTTP and template layer.
 
+use std::hash::Hash;
+
 use axum::{
     Form, Json,
     extract::{Multipart, Query, State},
@@ -14,11 +16,13 @@ use tower_sessions::Session;
 
 use crate::{
     AppState,
-    handlers::status::persona_status,
+    handlers::{revalidate, status::persona_status},
+    middleware::session_state,
     services::{
-        config, memory,
+        config, fs, memory,
         memory_worker::State as UpdateState,
         persona::{self, ThreadMemoryDefaults},
+        session as session_svc,
         thread_memory::{
             DEFAULT_THREAD_MEMORY_INTERVAL_MINUTES as DEFAULT_INTERVAL_MINUTES,
             DEFAULT_THREAD_MEMORY_MESSAGE_FLOOR as DEFAULT_MESSAGE_FLOOR,
@@ -56,7 +60,12 @@ pub async fn view(
     let memory_updating =
         state.memory.get_update_status(&selected).state == UpdateState::Running;
 
-    render_memory(
+    let etag = memory_view_etag(&state, &session, &headers, &selected, memory_updating).await;
+    if revalidate::etag_matches(&headers, &etag) {
+        return revalidate::not_modified(&etag);
+    }
+
+    let mut resp = render_memory(
         &state,
         &session,
         &headers,
@@ -66,7 +75,41 @@ pub async fn view(
             ..ViewOpts::default()
         },
     )
-    .await
+    .await;
+    if resp.status().is_success() {
+        revalidate::set_revalidation_headers(&mut resp, &etag);
+    }
+    resp
+}
+
+/// Hash of every input the memory page renders from: the selected persona's
+/// memory file, the memory and persona directories (for which files exist),
+/// config, the persona's config, and the sidebar listing itself — directory
+/// mtimes can't vouch for in-place rewrites of the files inside them.
+async fn memory_view_etag(
+    state: &AppState,
+    session: &Session,
+    headers: &HeaderMap,
+    selected: &str,
+    memory_updating: bool,
+) -> String {
+    let mut h = revalidate::etag_hasher();
+    selected.hash(&mut h);
+    memory_updating.hash(&mut h);
+    is_htmx(headers).hash(&mut h);
+    session_state::current_csrf_token(session).await.hash(&mut h);
+    session_state::current_session_id(session).await.hash(&mut h);
+    memory::file_stamp(&state.data_dir, selected).await.hash(&mut h);
+    session_svc::list_sessions(&state.sessions_dir).await.hash(&mut h);
+    for path in [
+        memory::memory_dir(&state.data_dir),
+        persona::personas_dir(&state.data_dir),
+        config::config_file(&state.data_dir),
+        persona::config_file(&state.data_dir, selected),
+    ] {
+        fs::stat_stamp(&path).await.hash(&mut h);
+    }
+    revalidate::weak_etag(h)
 }
 
 // =============================================================================
@@ -576,21 +619,13 @@ async fn render_memory(
     let personas = persona::list_personas(&state.data_dir).await;
     let cfg = config::load_config(&state.data_dir).await;
 
-    let memory_content = if selected.is_empty() {
-        String::new()
-    } else {
-        memory::get_memory_content(&state.data_dir, selected).await
-    };
-
     // The `memoryView` Alpine component does `new Date(parseInt(timestamp) * 1000)`
     // — it expects Unix seconds, not an ISO string.
-    let last_update = if selected.is_empty() {
-        String::new()
+    let (memory_content, last_update) = if selected.is_empty() {
+        (String::new(), String::new())
     } else {
-        memory::get_mtime_secs(&state.data_dir, selected)
-            .await
-            .map(|s| s.to_string())
-            .unwrap_or_default()
+        let (content, mtime) = memory::get_memory_with_mtime_secs(&state.data_dir, selected).await;
+        (content, mtime.map(|s| s.to_string()).unwrap_or_default())
     };
 
     let persona_cfg = if selected.is_empty() {
@@ -599,7 +634,7 @@ async fn render_memory(
         persona::load_persona_config(&state.data_dir, selected).await
     };
 
-    let mut ctx = super::chat::base_chat_context(state, session).await;
+    let mut ctx = super::chat::base_chat_context(state, session, &cfg).await;
     ctx.insert("page", "memory");
     ctx.insert("show_home", &false);
     ctx.insert("selected_persona", &selected);
@@ -4,6 +4,7 @@ pub mod context;
 pub mod memory;
 pub mod persona;
 pub mod prompts;
+pub mod revalidate;
 pub mod session;
 pub mod settings;
 pub mod setup;
@@ -12,8 +12,9 @@ use tower_sessions::Session;
 
 use crate::{
     AppState,
-    handlers::status::persona_status,
+    handlers::{chat::is_htmx, status::persona_status},
     services::{
+        config,
         context_files::ContextScope,
         persona::{self, PersonaConfig, PersonaError},
     },
@@ -38,8 +39,11 @@ pub async fn view(
     headers: HeaderMap,
     Query(q): Query<PersonaQuery>,
 ) -> Response {
-    let personas = persona::list_personas(&state.data_dir).await;
-    let cfg = crate::services::config::load_config(&state.data_dir).await;
+    // One scan yields both the list and each persona's identity file, so
+    // the preview below doesn't re-list the selected persona's dir.
+    let scanned = persona::scan_personas(&state.data_dir).await;
+    let personas: Vec<String> = scanned.keys().cloned().collect();
+    let cfg = config::load_config(&state.data_dir).await;
 
     // Pick the selected persona in priority order.
     let selected = q
@@ -58,10 +62,9 @@ pub async fn view(
         persona::load_persona_config(&state.data_dir, &selected).await
     };
 
-    let preview = if selected.is_empty() {
-        String::new()
-    } else {
-        persona::get_preview(&state.data_dir, &selected).await
+    let preview = match scanned.get(&selected) {
+        Some(path) => persona::read_preview(path).await,
+        None => String::new(),
     };
 
     // Persona-scoped context files summary — for the "Context Files" badge.
@@ -85,7 +88,7 @@ pub async fn view(
 
     let has_default_mode = persona_cfg.default_mode.is_some();
 
-    let mut ctx = super::chat::base_chat_context(&state, &session).await;
+    let mut ctx = super::chat::base_chat_context(&state, &session, &cfg).await;
     ctx.insert("page", "persona");
     ctx.insert("show_home", &false);
     ctx.insert("personas", &personas);
@@ -103,7 +106,7 @@ pub async fn view(
     );
     ctx.insert("persona_has_default_mode", &has_default_mode);
 
-    let htmx = crate::handlers::chat::is_htmx(&headers);
+    let htmx = is_htmx(&headers);
     ctx.insert("is_htmx", &htmx);
 
     let template = if htmx {
@@ -15,7 +15,10 @@ use tower_sessions::Session;
 use crate::{
     AppState,
     handlers::status::prompt_status,
-    services::prompts::{self, PROMPTS},
+    services::{
+        config,
+        prompts::{self, PROMPTS},
+    },
 };
 
 // =============================================================================
@@ -56,7 +59,8 @@ pub async fn view(
     let prompts_json =
         serde_json::to_string(&entries).unwrap_or_else(|_| "[]".to_string());
 
-    let mut ctx = super::chat::base_chat_context(&state, &session).await;
+    let cfg = config::load_config(&state.data_dir).await;
+    let mut ctx = super::chat::base_chat_context(&state, &session, &cfg).await;
     ctx.insert("page", "prompts");
     ctx.insert("show_home", &false);
     ctx.insert("prompts", &entries);
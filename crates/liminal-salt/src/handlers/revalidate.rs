@@ -0,0 +1,78 @@
+//! Conditional-GET plumbing shared by the full-page views that support
+//! revalidation (thread view, memory tab). Each handler hashes its own inputs
+//! into a weak ETag; this module owns the header side so every view answers
+//! `If-None-Match` the same way.
+
+use std::{
+    hash::{BuildHasher, DefaultHasher, Hash, Hasher, RandomState},
+    sync::LazyLock,
+};
+
+use axum::{
+    http::{HeaderMap, HeaderValue, StatusCode, header},
+    response::{IntoResponse, Response},
+};
+
+/// Drawn once per process. Templates and static markup are compiled into
+/// (or loaded at start by) the binary, so a page from a previous run must
+/// never revalidate — even across a rebuild that didn't bump the version.
+static BOOT_NONCE: LazyLock<u64> = LazyLock::new(|| RandomState::new().hash_one(0u8));
+
+/// Hasher for a view ETag, pre-seeded with the build identity (crate version
+/// + boot nonce). Handlers hash their own inputs on top and finish with
+/// `weak_etag`.
+pub(crate) fn etag_hasher() -> DefaultHasher {
+    let mut h = DefaultHasher::new();
+    env!("CARGO_PKG_VERSION").hash(&mut h);
+    BOOT_NONCE.hash(&mut h);
+    h
+}
+
+pub(crate) fn weak_etag(h: DefaultHasher) -> String {
+    format!("W/\"{:016x}\"", h.finish())
+}
+
+pub(crate) fn etag_matches(headers: &HeaderMap, etag: &str) -> bool {
+    headers
+        .get(header::IF_NONE_MATCH)
+        .is_some_and(|v| v.as_bytes() == etag.as_bytes())
+}
+
+pub(crate) fn set_revalidation_headers(resp: &mut Response, etag: &str) {
+    let headers = resp.headers_mut();
+    if let Ok(v) = HeaderValue::from_str(etag) {
+        headers.insert(header::ETAG, v);
+    }
+    // Always revalidate; the same URL serves whichever thread (or persona)
+    // is current.
+    headers.insert(header::CACHE_CONTROL, HeaderValue::from_static("private, no-cache"));
+    headers.insert(header::VARY, HeaderValue::from_static("HX-Request, Cookie"));
+}
+
+/// Empty 304 carrying the same validators a full response would.
+pub(crate) fn not_modified(etag: &str) -> Response {
+    let mut resp = StatusCode::NOT_MODIFIED.into_response();
+    set_revalidation_headers(&mut resp, etag);
+    resp
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn etag_is_stable_within_a_process_and_keyed_on_inputs() {
+        let tag = |input: &str| {
+            let mut h = etag_hasher();
+            input.hash(&mut h);
+            weak_etag(h)
+        };
+        assert_eq!(tag("a"), tag("a"));
+        assert_ne!(tag("a"), tag("b"));
+        assert!(tag("a").starts_with("W/\""));
+
+        let mut bare = DefaultHasher::new();
+        "a".hash(&mut bare);
+        assert_ne!(tag("a"), weak_etag(bare), "build identity must be mixed in");
+    }
+}
@@ -8,7 +8,7 @@
 use axum::{
     Form, Json,
     extract::{Multipart, State},
-    http::{HeaderMap, StatusCode},
+    http::{HeaderMap, StatusCode, header},
     response::{Html, IntoResponse, Response},
 };
 use serde::Deserialize;
@@ -18,7 +18,9 @@ use tower_sessions::Session;
 use crate::{
     AppState,
     services::{
-        config, context_files::ContextScope, providers,
+        config,
+        context_files::{ContextFileEntry, ContextScope, LocalDirectoryEntry},
+        providers,
     },
 };
 
@@ -125,8 +127,8 @@ pub async fn save_context_history_limit(
     // 10..=500 with 50 fallback — matches Python's clamp.
     let value: u32 = raw
         .parse::<i64>()
-        .map(|v| v.clamp(10, 500) as u32)
-        .unwrap_or(50);
+        .map(config::clamp_context_history_limit)
+        .unwrap_or(config::CONTEXT_HISTORY_LIMIT_DEFAULT);
 
     let mut cfg = config::load_config(&state.data_dir).await;
     cfg.context_history_limit = value;
@@ -214,11 +216,12 @@ pub async fn validate_provider_api_key(
         .into_response();
     }
 
-    Json(serde_json::json!({
-        "valid": true,
-        "models": models,
-    }))
-    .into_response()
+    // The list's JSON is cached with it — splice rather than re-serialize.
+    (
+        [(header::CONTENT_TYPE, "application/json")],
+        format!(r#"{{"valid":true,"models":{}}}"#, models.json),
+    )
+        .into_response()
 }
 
 // =============================================================================
@@ -258,16 +261,15 @@ pub async fn save_provider_model(
         .into_response();
     }
 
-    let mut cfg = config::load_config(&state.data_dir).await;
+    let (mut cfg, source) = config::load_config_with_source(&state.data_dir).await;
 
     // Corruption safety check — matches Python. If the caller wants to keep
-    // the existing key but the loaded config has no key AND the file does
-    // exist on disk, that's almost certainly a broken load (e.g. JSON parse
-    // returned default). Refuse to clobber rather than save an empty key.
-    if keep_existing_key
-        && cfg.api_key.is_empty()
-        && config::config_file_exists(&state.data_dir).await
-    {
+    // the existing key but config.json exists and couldn't be read/parsed,
+    // the loaded config is a default with no key. Refuse to clobber rather
+    // than save an empty key. Our own writes go through `write_atomic`, so
+    // this only fires for a hand-edited or externally damaged file — which
+    // is exactly when overwriting it would lose the user's key.
+    if keep_existing_key && cfg.api_key.is_empty() && source == config::ConfigSource::Unreadable {
         tracing::error!("Config appears corrupted — load returned empty but file exists");
         return Json(serde_json::json!({
             "success": false,
@@ -318,16 +320,15 @@ async fn render_settings(
 
     let provider_list = providers::metadata_list();
     let has_api_key = !cfg.api_key.is_empty();
-    let providers_json = serde_json::to_string(&provider_list).unwrap_or_else(|_| "[]".into());
     let local_dirs_json = serde_json::to_string(&local_dirs).unwrap_or_else(|_| "[]".into());
 
-    let mut ctx = super::chat::base_chat_context(state, session).await;
+    let mut ctx = super::chat::base_chat_context(state, session, &cfg).await;
     ctx.insert("page", "settings");
     ctx.insert("show_home", &false);
     ctx.insert("model", &cfg.model);
     ctx.insert("provider", &cfg.provider);
     ctx.insert("providers", &provider_list);
-    ctx.insert("providers_json", &providers_json);
+    ctx.insert("providers_json", providers::metadata_json());
     ctx.insert("has_api_key", &has_api_key);
     ctx.insert("context_history_limit", &cfg.context_history_limit);
     ctx.insert("context_files", &ctx_files);
@@ -349,8 +350,8 @@ async fn render_settings(
 }
 
 fn badge_count(
-    files: &[crate::services::context_files::ContextFileEntry],
-    local_dirs: &[crate::services::context_files::LocalDirectoryEntry],
+    files: &[ContextFileEntry],
+    local_dirs: &[LocalDirectoryEntry],
 ) -> usize {
     let enabled_files = files.iter().filter(|f| f.enabled).count();
     let enabled_local: usize = local_dirs
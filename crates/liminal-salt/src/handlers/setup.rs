@@ -182,9 +182,6 @@ async fn step1(
         if cfg.default_persona.is_empty() {
             cfg.default_persona = "assistant".to_string();
         }
-        if cfg.context_history_limit == 0 {
-            cfg.context_history_limit = 50;
-        }
         if let Err(err) = config::save_config(&state.data_dir, &cfg).await {
             tracing::error!(error = %err, "step1: save_config failed");
             return (StatusCode::INTERNAL_SERVER_ERROR, "config save failed").into_response();
@@ -220,8 +217,7 @@ async fn render_step1(
     args: StepArgs<'_>,
 ) -> Response {
     let mut ctx = base_ctx(session).await;
-    let provider_list = providers::metadata_list();
-    ctx.insert("providers", &provider_list);
+    ctx.insert("providers_json", providers::metadata_json());
     ctx.insert("selected_provider", args.provider);
     ctx.insert("api_key", args.api_key);
     if let Some(e) = args.error {
@@ -269,7 +265,7 @@ async fn step2(
                 session,
                 headers,
                 Step2Args {
-                    api_key: &cfg.api_key,
+                    cfg: &cfg,
                     selected_model: &selected_model,
                     selected_theme: &selected_theme,
                     selected_mode: &selected_mode,
@@ -312,7 +308,7 @@ async fn step2(
         session,
         headers,
         Step2Args {
-            api_key: &cfg.api_key,
+            cfg: &cfg,
             selected_model: &cfg.model,
             selected_theme: &selected_theme,
             selected_mode: &selected_mode,
@@ -323,7 +319,7 @@ async fn step2(
 }
 
 struct Step2Args<'a> {
-    api_key: &'a str,
+    cfg: &'a config::AppConfig,
     selected_model: &'a str,
     selected_theme: &'a str,
     selected_mode: &'a str,
@@ -340,11 +336,12 @@ async fn render_step2(
 
     // Fetch models. Failure is a distinct error path — matches Python's
     // "could not fetch, go back and check the key" branch.
-    let cfg = config::load_config(&state.data_dir).await;
-    let provider = providers::by_id(&cfg.provider).unwrap_or(providers::Provider::OpenRouter);
-    let models = provider.list_models(&state.http, args.api_key).await;
+    // Unlike /settings/available-models/, an unknown or missing provider falls
+    // back to OpenRouter (the wizard's default) instead of erroring.
+    let models = super::api::configured_models(state, args.cfg, true)
+        .await
+        .unwrap_or_default();
     let themes_list = themes::list_themes().await;
-    let models_json = serde_json::to_string(&models).unwrap_or_else(|_| "[]".into());
     let themes_json = serde_json::to_string(&themes_list).unwrap_or_else(|_| "[]".into());
 
     let error_msg = if models.is_empty() {
@@ -353,11 +350,10 @@ async fn render_step2(
         args.error
     };
 
-    ctx.insert("available_models", &models);
-    ctx.insert("available_models_json", &models_json);
-    ctx.insert("model_count", &models.len());
+    // Only the pre-serialized list goes into the context: inserting the
+    // Vec itself would convert every model into a tera Value per render.
+    ctx.insert("available_models_json", &models.json);
     ctx.insert("selected_model", args.selected_model);
-    ctx.insert("themes", &themes_list);
     ctx.insert("themes_json", &themes_json);
     ctx.insert("selected_theme", args.selected_theme);
     ctx.insert("selected_mode", args.selected_mode);
@@ -90,9 +90,8 @@ pub async fn status(
     }
 
     let status = state.memory.get_thread_update_status(&session_id);
-    let (memory, updated_at) = session_svc::load_session(&state.sessions_dir, &session_id)
+    let (memory, updated_at) = session_svc::load_thread_memory(&state.sessions_dir, &session_id)
         .await
-        .map(|s| (s.thread_memory, s.thread_memory_updated_at))
         .unwrap_or_default();
 
     // Extend the status struct's JSON with the memory/updated_at fields so
@@ -30,8 +30,7 @@ pub async fn require_app_ready(
         return next.run(req).await;
     }
 
-    let cfg = config::load_config(&state.data_dir).await;
-    if config::is_app_ready(&cfg) {
+    if config::app_ready(&state.data_dir).await {
         return next.run(req).await;
     }
 
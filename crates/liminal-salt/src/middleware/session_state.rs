@@ -60,7 +60,12 @@ pub async fn user_timezone(session: &Session) -> String {
         .unwrap_or_else(|| "UTC".to_string())
 }
 
+/// The browser reports its timezone with every message; only write when it
+/// actually changed so the common case leaves the session record untouched.
 pub async fn set_user_timezone(session: &Session, tz: &str) {
+    if session.get::<String>(TIMEZONE_KEY).await.ok().flatten().as_deref() == Some(tz) {
+        return;
+    }
     let _ = session.insert(TIMEZONE_KEY, tz).await;
 }
 
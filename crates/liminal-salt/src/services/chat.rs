@@ -2,9 +2,14 @@
 //! append assistant message, save. Ports `chat/services/chat_core.py` semantics.
 //!
 //! Unlike the Python `ChatCore` class, this module is stateless: each
-//! `send_message` call loads the session fresh and writes through
+//! `send_message` call loads the session fresh (or takes the one the caller
+//! just loaded, via `send_message_with_session`) and writes through
 //! `session::save_chat_history`. That preserves the "ChatCore doesn't own the
 //! file" invariant from CLAUDE.md.
+//!
+//! Title generation for the first exchange happens here too (when
+//! `SendContext::auto_title` is set), after the reply is saved: a slow or
+//! abandoned title call never costs the user the reply.
 
 use std::path::Path;
 use std::time::Duration;
@@ -13,7 +18,8 @@ use chrono::{DateTime, TimeZone, Utc};
 use chrono_tz::Tz;
 
 use crate::services::llm::{ChatLlm, LlmError, LlmMessage};
-use crate::services::session::{self, Message, Role, SessionError};
+use crate::services::session::{self, Message, Role, Session, SessionError};
+use crate::services::summarizer;
 
 const SEND_TIMEOUT: Duration = Duration::from_secs(120);
 const MAX_RETRIES: u32 = 2;
@@ -28,6 +34,21 @@ pub struct SendContext<'a> {
     pub user_timezone: &'a str,
     pub assistant_timezone: Option<&'a str>,
     pub context_history_limit: usize,
+    /// Generate + lock a title after the turn if the session doesn't have a
+    /// locked one yet. Applied in its own locked write once the reply is
+    /// saved, re-checking the lock so a concurrent rename wins.
+    pub auto_title: bool,
+    /// Clear the saved composer draft in the same write — the message it held
+    /// has just been sent.
+    pub clear_draft: bool,
+}
+
+/// A successful chat turn. `title` is `Some` only when this turn generated
+/// (and persisted) a new session title.
+#[derive(Debug)]
+pub struct SendOutcome {
+    pub reply: String,
+    pub title: Option<String>,
 }
 
 /// Why a chat turn failed. `Display` renders the user-facing error body; the
@@ -43,8 +64,9 @@ pub enum ChatError {
 }
 
 /// Append a user message, run the LLM, append the assistant response, save
-/// the session. On success returns the assistant's reply; on failure returns
-/// a typed error the handler can shape into a response or short-circuit on.
+/// the session. On success returns the assistant's reply (plus the generated
+/// title, if any); on failure returns a typed error the handler can shape into
+/// a response or short-circuit on.
 ///
 /// `skip_user_save = true` means the user message is already persisted
 /// upstream (e.g. by `start_chat` which saves before dispatching to `send`).
@@ -53,17 +75,30 @@ pub async fn send_message<L: ChatLlm>(
     llm: &L,
     user_input: &str,
     skip_user_save: bool,
-) -> Result<String, ChatError> {
+) -> Result<SendOutcome, ChatError> {
     // 1. Load the session. Missing / invalid-id surface distinctly so the
     //    handler can shape a response (404 vs 400 vs 500).
-    let mut session = match session::load_session(ctx.sessions_dir, ctx.session_id).await {
+    let session = match session::load_session(ctx.sessions_dir, ctx.session_id).await {
         Ok(s) => s,
         Err(SessionError::NotFound(id) | SessionError::InvalidId(id)) => {
             return Err(ChatError::SessionNotFound(id));
         }
         Err(err) => return Err(ChatError::Session(err)),
     };
+    send_message_with_session(ctx, llm, session, user_input, skip_user_save).await
+}
 
+/// `send_message` for a caller that has already loaded `ctx.session_id`
+/// (the send handler needs it to build the system prompt), so the file isn't
+/// read and parsed a second time. The final save still goes through the
+/// session lock, so fields changed concurrently are preserved.
+pub async fn send_message_with_session<L: ChatLlm>(
+    ctx: &SendContext<'_>,
+    llm: &L,
+    mut session: Session,
+    user_input: &str,
+    skip_user_save: bool,
+) -> Result<SendOutcome, ChatError> {
     if !skip_user_save {
         session.messages.push(Message {
             role: Role::User,
@@ -82,30 +117,50 @@ pub async fn send_message<L: ChatLlm>(
     );
 
     // 3. Call LLM with retries. 2-attempt policy with a 2s backoff between tries.
-    let assistant_text = run_with_retry(llm, &payload).await.map_err(|err| {
-        tracing::warn!(
-            session_id = ctx.session_id,
-            error = %err,
-            "LLM call failed after retries",
-        );
-        ChatError::LlmFailed(err)
-    })?;
+    let assistant_text = match run_with_retry(llm, &payload).await {
+        Ok(text) => text,
+        Err(err) => {
+            tracing::warn!(
+                session_id = ctx.session_id,
+                error = %err,
+                "LLM call failed after retries",
+            );
+            // The client emptied its composer on submit; don't let the draft
+            // it was holding come back on reload just because the turn failed.
+            if ctx.clear_draft
+                && let Err(err) = session::clear_draft(ctx.sessions_dir, ctx.session_id).await
+            {
+                tracing::warn!(session_id = ctx.session_id, error = %err, "clear_draft failed");
+            }
+            return Err(ChatError::LlmFailed(err));
+        }
+    };
 
-    // 4. Append assistant message + persist. `save_chat_history` RMWs through
-    //    the session lock so scenario/thread_memory/pinned/draft survive.
     session.messages.push(Message {
         role: Role::Assistant,
         content: assistant_text.clone(),
         timestamp: session::now_timestamp(),
     });
 
+    // 4. Persist the reply before anything else can fail or stall.
+    //    `save_chat_history` RMWs through the session lock so
+    //    scenario/thread_memory/pinned/draft survive, and keeps a title that
+    //    was locked (renamed) while the LLM was answering. The draft is only
+    //    touched when asked.
+    let title_source = (ctx.auto_title && !session.title_locked.unwrap_or(false)).then(|| {
+        (
+            first_content(&session.messages, Role::User).to_string(),
+            first_content(&session.messages, Role::Assistant).to_string(),
+        )
+    });
     if let Err(err) = session::save_chat_history(
         ctx.sessions_dir,
         ctx.session_id,
         &session.title,
         &session.persona,
         session.messages,
-        None, // don't touch title_locked here — title generation is a separate step
+        None,
+        ctx.clear_draft,
     )
     .await
     {
@@ -116,7 +171,39 @@ pub async fn send_message<L: ChatLlm>(
         );
     }
 
-    Ok(assistant_text)
+    // 5. Title the session off the first exchange, once. The source messages
+    //    were taken from memory above — no need to re-read the file.
+    //    `set_generated_title` re-checks the lock under the session lock, so a
+    //    rename made during either LLM call is never overwritten.
+    let mut new_title: Option<String> = None;
+    if let Some((first_user, first_assistant)) = title_source
+        && !first_user.is_empty()
+        && !first_assistant.is_empty()
+    {
+        let title = summarizer::generate_title(llm, &first_user, &first_assistant).await;
+        match session::set_generated_title(ctx.sessions_dir, ctx.session_id, &title).await {
+            Ok(true) => new_title = Some(title),
+            Ok(false) => {}
+            Err(err) => tracing::warn!(
+                session_id = ctx.session_id,
+                error = %err,
+                "title save failed",
+            ),
+        }
+    }
+
+    Ok(SendOutcome {
+        reply: assistant_text,
+        title: new_title,
+    })
+}
+
+fn first_content(messages: &[Message], role: Role) -> &str {
+    messages
+        .iter()
+        .find(|m| m.role == role)
+        .map(|m| m.content.as_str())
+        .unwrap_or("")
 }
 
 async fn run_with_retry<L: ChatLlm>(
@@ -1,12 +1,14 @@
 use std::{
-    collections::BTreeMap,
+    collections::{BTreeMap, HashMap},
     path::{Path, PathBuf},
-    sync::LazyLock,
+    sync::{LazyLock, Mutex as StdMutex},
 };
 
 use regex::Regex;
 use serde::{Deserialize, Serialize};
 
+use crate::services::fs::{FileStamp, file_stamp};
+
 /// App configuration. Loaded from `<data_dir>/config.json` and re-saved whenever
 /// settings change. Field names serialize as `snake_case` (matches persona
 /// configs and session JSON). `extras` catches any unknown keys so they
@@ -34,6 +36,23 @@ pub fn is_app_ready(config: &AppConfig) -> bool {
     config.setup_complete && config.agreement_accepted == current_agreement_version()
 }
 
+/// `is_app_ready` for the config on disk. The app-ready gate runs on every
+/// request but needs two fields, so a cache hit is checked in place rather
+/// than cloning the whole config out; a miss falls back to `load_config`.
+pub async fn app_ready(data_dir: &Path) -> bool {
+    let path = config_file(data_dir);
+    if let Ok(meta) = tokio::fs::metadata(&path).await {
+        let stamp = file_stamp(&meta);
+        let cache = CONFIG_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some((cached_stamp, cfg)) = cache.get(&path)
+            && *cached_stamp == stamp
+        {
+            return is_app_ready(cfg);
+        }
+    }
+    is_app_ready(&load_config(data_dir).await)
+}
+
 /// Production data-dir resolver. In Tauri (M2) this is the only function that
 /// changes — it will return `app_data_dir()` instead of a repo-relative path.
 pub fn data_dir() -> PathBuf {
@@ -48,23 +67,83 @@ pub fn config_file(data_dir: &Path) -> PathBuf {
     data_dir.join("config.json")
 }
 
+pub const CONTEXT_HISTORY_LIMIT_DEFAULT: u32 = 50;
+pub const CONTEXT_HISTORY_LIMIT_MIN: u32 = 10;
+pub const CONTEXT_HISTORY_LIMIT_MAX: u32 = 500;
+
+/// Clamp a user-supplied history limit into `10..=500` — matches Python's
+/// `save_max_history` clamp.
+pub fn clamp_context_history_limit(raw: i64) -> u32 {
+    raw.clamp(
+        CONTEXT_HISTORY_LIMIT_MIN as i64,
+        CONTEXT_HISTORY_LIMIT_MAX as i64,
+    ) as u32
+}
+
 /// Load config from `<data_dir>/config.json`. Missing file or corrupt JSON both
 /// return `AppConfig::default()` — matches Python's `load_config()` behavior.
+///
+/// `context_history_limit` is normalized here, once: absent/0 becomes the
+/// default and anything else is clamped, so callers can use it as-is.
 pub async fn load_config(data_dir: &Path) -> AppConfig {
+    load_config_with_source(data_dir).await.0
+}
+
+/// Where a loaded config came from. Lets callers tell "no config yet" apart
+/// from "config.json is there but couldn't be used" without a second stat.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum ConfigSource {
+    File,
+    Missing,
+    Unreadable,
+}
+
+/// `load_config` plus the sentinel above. One open, no existence probe.
+pub async fn load_config_with_source(data_dir: &Path) -> (AppConfig, ConfigSource) {
+    let (mut cfg, source) = read_config(data_dir).await;
+    cfg.context_history_limit = match cfg.context_history_limit {
+        0 => CONTEXT_HISTORY_LIMIT_DEFAULT,
+        n => clamp_context_history_limit(n as i64),
+    };
+    (cfg, source)
+}
+
+async fn read_config(data_dir: &Path) -> (AppConfig, ConfigSource) {
     let path = config_file(data_dir);
+    let stamp = match tokio::fs::metadata(&path).await {
+        Ok(meta) => file_stamp(&meta),
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => {
+            forget_cached(&path);
+            return (AppConfig::default(), ConfigSource::Missing);
+        }
+        Err(err) => {
+            tracing::error!(?path, error = %err, "config stat failed");
+            return (AppConfig::default(), ConfigSource::Unreadable);
+        }
+    };
+    if let Some(cfg) = cached_config(&path, stamp) {
+        return (cfg, ConfigSource::File);
+    }
+
     let bytes = match tokio::fs::read(&path).await {
         Ok(b) => b,
-        Err(err) if err.kind() == std::io::ErrorKind::NotFound => return AppConfig::default(),
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => {
+            forget_cached(&path);
+            return (AppConfig::default(), ConfigSource::Missing);
+        }
         Err(err) => {
             tracing::error!(?path, error = %err, "config read failed");
-            return AppConfig::default();
+            return (AppConfig::default(), ConfigSource::Unreadable);
         }
     };
     match serde_json::from_slice::<AppConfig>(&bytes) {
-        Ok(cfg) => cfg,
+        Ok(cfg) => {
+            store_cached(&path, stamp, &cfg);
+            (cfg, ConfigSource::File)
+        }
         Err(err) => {
             tracing::error!(?path, error = %err, "config file corrupt");
-            AppConfig::default()
+            (AppConfig::default(), ConfigSource::Unreadable)
         }
     }
 }
@@ -72,15 +151,44 @@ pub async fn load_config(data_dir: &Path) -> AppConfig {
 /// Save config atomically: write to `<path>.tmp`, fsync, rename. Concurrent
 /// per-request reads (`load_config`) never see a truncated file.
 pub async fn save_config(data_dir: &Path, config: &AppConfig) -> std::io::Result<()> {
+    let path = config_file(data_dir);
     let bytes = serde_json::to_vec_pretty(config)
         .map_err(|e| std::io::Error::new(std::io::ErrorKind::InvalidData, e))?;
-    crate::services::fs::write_atomic(&config_file(data_dir), &bytes).await
+    crate::services::fs::write_atomic(&path, &bytes).await?;
+    // Evict rather than prime: a stat taken after the rename may already
+    // belong to an overlapping save, which would pin this config under the
+    // other write's stamp. The next load stamps and parses what's on disk.
+    forget_cached(&path);
+    Ok(())
 }
 
-pub async fn config_file_exists(data_dir: &Path) -> bool {
-    tokio::fs::try_exists(config_file(data_dir))
-        .await
-        .unwrap_or(false)
+// =============================================================================
+// Config cache — keyed by path, validated against the file stamp (mtime, len, inode)
+//
+// Nearly every request loads config (app-ready gate + handler), and the file
+// only changes when settings are saved. A stat per load replaces open + read +
+// parse; an external edit changes the stamp and is picked up on the next load.
+// =============================================================================
+
+static CONFIG_CACHE: LazyLock<StdMutex<HashMap<PathBuf, (FileStamp, AppConfig)>>> =
+    LazyLock::new(|| StdMutex::new(HashMap::new()));
+
+fn cached_config(path: &Path, stamp: FileStamp) -> Option<AppConfig> {
+    let cache = CONFIG_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    match cache.get(path) {
+        Some((cached_stamp, cfg)) if *cached_stamp == stamp => Some(cfg.clone()),
+        _ => None,
+    }
+}
+
+fn store_cached(path: &Path, stamp: FileStamp, config: &AppConfig) {
+    let mut cache = CONFIG_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.insert(path.to_path_buf(), (stamp, config.clone()));
+}
+
+fn forget_cached(path: &Path) {
+    let mut cache = CONFIG_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.remove(path);
 }
 
 // =============================================================================
@@ -131,3 +239,78 @@ pub fn current_agreement_version() -> &'static str {
     AGREEMENT.version.as_str()
 }
 
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[tokio::test]
+    async fn load_sees_saves_and_external_edits() {
+        let tmp = tempfile::tempdir().unwrap();
+        let (_, source) = load_config_with_source(tmp.path()).await;
+        assert_eq!(source, ConfigSource::Missing);
+
+        let cfg = AppConfig {
+            model: "a/first".into(),
+            ..AppConfig::default()
+        };
+        save_config(tmp.path(), &cfg).await.unwrap();
+        assert_eq!(load_config(tmp.path()).await.model, "a/first");
+
+        // Out-of-band edit (different length) must invalidate the cache.
+        tokio::fs::write(
+            config_file(tmp.path()),
+            br#"{"model": "b/second-model"}"#,
+        )
+        .await
+        .unwrap();
+        assert_eq!(load_config(tmp.path()).await.model, "b/second-model");
+
+        tokio::fs::write(config_file(tmp.path()), b"{not json").await.unwrap();
+        let (cfg, source) = load_config_with_source(tmp.path()).await;
+        assert_eq!(source, ConfigSource::Unreadable);
+        assert!(cfg.model.is_empty());
+    }
+
+    /// A same-length rewrite with the mtime pinned: the stamp's inode is what
+    /// invalidates the cached config.
+    #[cfg(unix)]
+    #[tokio::test]
+    async fn load_sees_same_length_atomic_rewrite() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = config_file(tmp.path());
+        let pinned = std::time::SystemTime::now() - std::time::Duration::from_secs(60);
+
+        crate::services::fs::write_atomic(&path, br#"{"model": "a/one"}"#)
+            .await
+            .unwrap();
+        std::fs::File::open(&path).unwrap().set_modified(pinned).unwrap();
+        assert_eq!(load_config(tmp.path()).await.model, "a/one");
+
+        crate::services::fs::write_atomic(&path, br#"{"model": "b/two"}"#)
+            .await
+            .unwrap();
+        std::fs::File::open(&path).unwrap().set_modified(pinned).unwrap();
+        assert_eq!(load_config(tmp.path()).await.model, "b/two");
+    }
+
+    #[tokio::test]
+    async fn app_ready_tracks_saved_config() {
+        let tmp = tempfile::tempdir().unwrap();
+        assert!(!app_ready(tmp.path()).await);
+
+        let ready = AppConfig {
+            setup_complete: true,
+            agreement_accepted: current_agreement_version().to_string(),
+            ..AppConfig::default()
+        };
+        save_config(tmp.path(), &ready).await.unwrap();
+        assert!(app_ready(tmp.path()).await);
+
+        let not_ready = AppConfig {
+            setup_complete: false,
+            ..ready
+        };
+        save_config(tmp.path(), &not_ready).await.unwrap();
+        assert!(!app_ready(tmp.path()).await);
+    }
+}
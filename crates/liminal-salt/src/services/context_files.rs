@@ -150,7 +150,6 @@ impl ContextScope {
     }
 
     async fn save_config(&self, config: &ScopeConfig) -> Result<(), ContextScopeError> {
-        tokio::fs::create_dir_all(&self.base_dir).await?;
         let bytes = serde_json::to_vec_pretty(config)
             .map_err(|e| std::io::Error::new(std::io::ErrorKind::InvalidData, e))?;
         crate::services::fs::write_atomic(&self.config_path(), &bytes).await?;
@@ -183,7 +182,6 @@ impl ContextScope {
         bytes: &[u8],
     ) -> Result<String, ContextScopeError> {
         let safe = sanitize_filename(filename).ok_or(ContextScopeError::InvalidFilename)?;
-        tokio::fs::create_dir_all(&self.base_dir).await?;
         crate::services::fs::write_atomic(&self.base_dir.join(&safe), bytes).await?;
         let mut cfg = self.load_config().await;
         cfg.files.insert(safe.clone(), FileState { enabled: true });
@@ -402,11 +400,11 @@ impl ContextScope {
             parts.push(format!("{}\n", self.header_description));
             for (name, _) in enabled_files {
                 let path = self.base_dir.join(name);
-                let Ok(body) = tokio::fs::read_to_string(&path).await else {
+                let Ok(body) = crate::services::fs::read_to_string_cached(&path).await else {
                     continue;
                 };
                 parts.push(format!("--- {name} ---"));
-                parts.push(body);
+                parts.push(body.to_string());
                 parts.push(String::new());
             }
         }
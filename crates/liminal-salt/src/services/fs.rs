@@ -4,8 +4,16 @@
 //! Every service that writes to `data/` goes through it so a concurrent
 //! lockless reader (e.g. `session::list_sessions` reading the sidebar while
 //! a background write is in flight) never sees a truncated-zero file.
+//!
+//! `read_to_string_cached` is its read-side counterpart for the text files a
+//! system prompt is assembled from on every turn.
 
-use std::path::{Path, PathBuf};
+use std::{
+    collections::HashMap,
+    path::{Path, PathBuf},
+    sync::{Arc, LazyLock, Mutex as StdMutex},
+    time::SystemTime,
+};
 
 use tokio::io::AsyncWriteExt;
 
@@ -14,19 +22,22 @@ use tokio::io::AsyncWriteExt;
 /// atomic, so a reader racing the write sees either the pre-write file or
 /// the post-write file — never an empty or half-written state.
 ///
-/// Creates the parent directory if absent. Overwrites any stale `<path>.tmp`
-/// left by a previous crashed write (the final `path` is what readers see).
+/// Creates the parent directory if absent — lazily, on the open's `NotFound`,
+/// so the steady state (directory already there) skips the `mkdir` walk.
+/// Overwrites any stale `<path>.tmp` left by a previous crashed write (the
+/// final `path` is what readers see).
 pub async fn write_atomic(path: &Path, bytes: &[u8]) -> std::io::Result<()> {
-    if let Some(parent) = path.parent() {
-        tokio::fs::create_dir_all(parent).await?;
-    }
     let tmp = tmp_path_for(path);
-    let mut f = tokio::fs::OpenOptions::new()
-        .write(true)
-        .create(true)
-        .truncate(true)
-        .open(&tmp)
-        .await?;
+    let mut f = match open_tmp(&tmp).await {
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => {
+            let Some(parent) = path.parent() else {
+                return Err(err);
+            };
+            tokio::fs::create_dir_all(parent).await?;
+            open_tmp(&tmp).await?
+        }
+        other => other?,
+    };
     f.write_all(bytes).await?;
     f.sync_all().await?;
     drop(f);
@@ -34,12 +45,92 @@ pub async fn write_atomic(path: &Path, bytes: &[u8]) -> std::io::Result<()> {
     Ok(())
 }
 
+async fn open_tmp(tmp: &Path) -> std::io::Result<tokio::fs::File> {
+    tokio::fs::OpenOptions::new()
+        .write(true)
+        .create(true)
+        .truncate(true)
+        .open(tmp)
+        .await
+}
+
 fn tmp_path_for(path: &Path) -> PathBuf {
     let mut s = path.as_os_str().to_os_string();
     s.push(".tmp");
     PathBuf::from(s)
 }
 
+// =============================================================================
+// File stamps
+// =============================================================================
+
+/// `(mtime, len, inode)` — the validator every file-backed cache and ETag in
+/// the app keys on. `write_atomic` renames a freshly created file into place,
+/// so the inode changes on every write through it; that catches a same-length
+/// rewrite landing within one mtime tick, which `(mtime, len)` alone misses.
+/// Not airtight: an in-place external edit keeps the inode, and a filesystem
+/// may recycle a freed inode number. Off unix the inode slot is always 0.
+pub(crate) type FileStamp = (SystemTime, u64, u64);
+
+pub(crate) fn file_stamp(meta: &std::fs::Metadata) -> FileStamp {
+    (
+        meta.modified().unwrap_or(SystemTime::UNIX_EPOCH),
+        meta.len(),
+        inode(meta),
+    )
+}
+
+#[cfg(unix)]
+fn inode(meta: &std::fs::Metadata) -> u64 {
+    std::os::unix::fs::MetadataExt::ino(meta)
+}
+
+#[cfg(not(unix))]
+fn inode(_meta: &std::fs::Metadata) -> u64 {
+    0
+}
+
+/// `file_stamp` for a path; `None` when it can't be stat'ed (usually missing).
+pub(crate) async fn stat_stamp(path: &Path) -> Option<FileStamp> {
+    let meta = tokio::fs::metadata(path).await.ok()?;
+    Some(file_stamp(&meta))
+}
+
+// =============================================================================
+// Stamped text cache
+// =============================================================================
+
+/// Text bodies keyed by path, validated against the file's `FileStamp`.
+static TEXT_CACHE: LazyLock<StdMutex<HashMap<PathBuf, (FileStamp, Arc<str>)>>> =
+    LazyLock::new(|| StdMutex::new(HashMap::new()));
+
+/// Cleared wholesale when reached — entries only outlive their files when
+/// personas or context files are deleted, so this is a backstop, not an LRU.
+const TEXT_CACHE_CAP: usize = 256;
+
+/// `tokio::fs::read_to_string` for files that are read far more often than
+/// they're written (persona identity, context uploads, persona memory). An
+/// unchanged file costs a `stat` instead of a read.
+pub async fn read_to_string_cached(path: &Path) -> std::io::Result<Arc<str>> {
+    let meta = tokio::fs::metadata(path).await?;
+    let stamp = file_stamp(&meta);
+    {
+        let cache = TEXT_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some((cached_stamp, body)) = cache.get(path)
+            && *cached_stamp == stamp
+        {
+            return Ok(body.clone());
+        }
+    }
+    let body: Arc<str> = tokio::fs::read_to_string(path).await?.into();
+    let mut cache = TEXT_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if cache.len() >= TEXT_CACHE_CAP {
+        cache.clear();
+    }
+    cache.insert(path.to_path_buf(), (stamp, body.clone()));
+    Ok(body)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -95,4 +186,44 @@ mod tests {
 
         let _ = tokio::join!(writer, reader);
     }
+
+    #[tokio::test]
+    async fn creates_missing_parent_dirs() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("a").join("b").join("x.json");
+        write_atomic(&path, b"{}").await.unwrap();
+        assert_eq!(tokio::fs::read(&path).await.unwrap(), b"{}");
+    }
+
+    #[tokio::test]
+    async fn cached_read_follows_rewrites() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("identity.md");
+        write_atomic(&path, b"first").await.unwrap();
+        assert_eq!(&*read_to_string_cached(&path).await.unwrap(), "first");
+        assert_eq!(&*read_to_string_cached(&path).await.unwrap(), "first");
+
+        write_atomic(&path, b"second body").await.unwrap();
+        assert_eq!(&*read_to_string_cached(&path).await.unwrap(), "second body");
+
+        tokio::fs::remove_file(&path).await.unwrap();
+        assert!(read_to_string_cached(&path).await.is_err());
+    }
+
+    /// Same length, same mtime: only the inode tells the two writes apart.
+    #[cfg(unix)]
+    #[tokio::test]
+    async fn cached_read_follows_same_length_rewrite_in_one_tick() {
+        let tmp = tempfile::tempdir().unwrap();
+        let path = tmp.path().join("identity.md");
+        let pinned = SystemTime::now() - std::time::Duration::from_secs(60);
+
+        write_atomic(&path, b"first").await.unwrap();
+        std::fs::File::open(&path).unwrap().set_modified(pinned).unwrap();
+        assert_eq!(&*read_to_string_cached(&path).await.unwrap(), "first");
+
+        write_atomic(&path, b"fifth").await.unwrap();
+        std::fs::File::open(&path).unwrap().set_modified(pinned).unwrap();
+        assert_eq!(&*read_to_string_cached(&path).await.unwrap(), "fifth");
+    }
 }
@@ -12,7 +12,10 @@
 
 use std::path::{Path, PathBuf};
 
+use tokio::io::AsyncReadExt;
+
 use crate::services::{
+    fs::FileStamp,
     llm::{ChatLlm, LlmError, LlmMessage},
     persona::{self, PersonaConfig},
     prompts::{self, PromptError},
@@ -60,6 +63,15 @@ fn memory_file(data_dir: &Path, persona_name: &str) -> PathBuf {
     memory_dir(data_dir).join(format!("{persona_name}.md"))
 }
 
+/// Stamp of a persona's memory file, for callers (the memory tab's ETag) that
+/// only need to know whether it changed. `None` when missing or invalid name.
+pub async fn file_stamp(data_dir: &Path, persona_name: &str) -> Option<FileStamp> {
+    if !persona::valid_persona_name(persona_name) {
+        return None;
+    }
+    crate::services::fs::stat_stamp(&memory_file(data_dir, persona_name)).await
+}
+
 // =============================================================================
 // File I/O
 // =============================================================================
@@ -74,14 +86,39 @@ pub async fn get_mtime(data_dir: &Path, persona_name: &str) -> Option<std::time:
     tokio::fs::metadata(&path).await.ok()?.modified().ok()
 }
 
-/// Same as `get_mtime`, coerced to Unix epoch seconds. Used by the memory view
-/// template (JS does `new Date(parseInt(timestamp) * 1000)`).
-pub async fn get_mtime_secs(data_dir: &Path, persona_name: &str) -> Option<u64> {
-    get_mtime(data_dir, persona_name)
-        .await?
-        .duration_since(std::time::UNIX_EPOCH)
+/// Memory content plus its mtime in Unix epoch seconds, for the memory view
+/// template (JS does `new Date(parseInt(timestamp) * 1000)`). Both come from
+/// one open file handle, so the view doesn't stat the path separately. A
+/// missing file or invalid name yields `("", None)`.
+pub async fn get_memory_with_mtime_secs(
+    data_dir: &Path,
+    persona_name: &str,
+) -> (String, Option<u64>) {
+    if !persona::valid_persona_name(persona_name) {
+        return (String::new(), None);
+    }
+    let path = memory_file(data_dir, persona_name);
+    let mut file = match tokio::fs::File::open(&path).await {
+        Ok(f) => f,
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => return (String::new(), None),
+        Err(err) => {
+            tracing::error!(?path, error = %err, "memory read failed");
+            return (String::new(), None);
+        }
+    };
+    let mtime = file
+        .metadata()
+        .await
         .ok()
-        .map(|d| d.as_secs())
+        .and_then(|meta| meta.modified().ok())
+        .and_then(|t| t.duration_since(std::time::UNIX_EPOCH).ok())
+        .map(|d| d.as_secs());
+    let mut content = String::new();
+    if let Err(err) = file.read_to_string(&mut content).await {
+        tracing::error!(?path, error = %err, "memory read failed");
+        return (String::new(), mtime);
+    }
+    (content, mtime)
 }
 
 /// Read a persona's memory. Returns "" when the file is missing, invalid name,
@@ -92,8 +129,8 @@ pub async fn get_memory_content(data_dir: &Path, persona_name: &str) -> String {
         return String::new();
     }
     let path = memory_file(data_dir, persona_name);
-    match tokio::fs::read_to_string(&path).await {
-        Ok(s) => s,
+    match crate::services::fs::read_to_string_cached(&path).await {
+        Ok(s) => s.to_string(),
         Err(err) if err.kind() == std::io::ErrorKind::NotFound => String::new(),
         Err(err) => {
             tracing::error!(?path, error = %err, "memory read failed");
@@ -143,16 +180,15 @@ pub async fn rename_memory(
     if !persona::valid_persona_name(new_name) {
         return Err(MemoryError::InvalidPersonaName(new_name.to_string()));
     }
+    // Same directory for both names, so if the source exists its parent
+    // does too — just try the rename.
     let old_path = memory_file(data_dir, old_name);
-    if !tokio::fs::try_exists(&old_path).await.unwrap_or(false) {
-        return Ok(());
-    }
     let new_path = memory_file(data_dir, new_name);
-    if let Some(parent) = new_path.parent() {
-        let _ = tokio::fs::create_dir_all(parent).await;
+    match tokio::fs::rename(&old_path, &new_path).await {
+        Ok(()) => Ok(()),
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => Ok(()),
+        Err(err) => Err(MemoryError::Io(err)),
     }
-    tokio::fs::rename(&old_path, &new_path).await?;
-    Ok(())
 }
 
 /// List persona names that have a memory file on disk. Sorted alphabetically.
@@ -34,7 +34,7 @@ use std::{
 };
 
 use chrono::{DateTime, SecondsFormat, Utc};
-use serde::Serialize;
+use serde::{Deserialize, Serialize};
 use tokio::{
     sync::{Mutex as TokioMutex, watch},
     task::JoinHandle,
@@ -184,6 +184,38 @@ struct PersonaCountEntry {
     missing: u32,
 }
 
+/// The slice of a session file the message-floor counter reads. Parsing into
+/// this instead of `session::Session` lets serde skip every message body
+/// rather than allocate it only to drop it.
+#[derive(Deserialize)]
+struct PersonaCountView {
+    persona: String,
+    #[serde(default)]
+    mode: Mode,
+    #[serde(default)]
+    messages: Vec<TimestampView>,
+}
+
+#[derive(Deserialize)]
+struct TimestampView {
+    #[serde(default)]
+    timestamp: String,
+}
+
+/// What the thread-memory scheduler reads from a session file: who owns it,
+/// its settings override, and enough of each message to count the ones past
+/// the summary cutoff. Message bodies are skipped, not copied.
+#[derive(Deserialize)]
+struct ThreadSchedSource {
+    persona: String,
+    #[serde(default)]
+    thread_memory_updated_at: String,
+    #[serde(default)]
+    thread_memory_settings: Option<session::ThreadMemorySettings>,
+    #[serde(default)]
+    messages: Vec<TimestampView>,
+}
+
 /// Per-session cache entry for the thread-memory scheduler. Keyed by mtime —
 /// reparse only when the underlying session JSON changes.
 struct ThreadSchedEntry {
@@ -920,8 +952,11 @@ impl MemoryWorker {
             if !filename.ends_with(".json") {
                 continue;
             }
-            let filepath = sessions_dir.join(&filename);
-            let Some(view) = self.cached_thread_view(&filepath, &filename).await else {
+            // Stat through the directory entry, as the persona scheduler does,
+            // rather than re-resolving the joined path.
+            let Ok(meta) = entry.metadata().await else { continue };
+            let Ok(mtime) = meta.modified() else { continue };
+            let Some(view) = self.cached_thread_view(&entry.path(), &filename, mtime).await else {
                 continue;
             };
             live.insert(filename.clone());
@@ -1005,9 +1040,12 @@ impl MemoryWorker {
         compute_next_sleep(&next_due_times)
     }
 
-    async fn cached_thread_view(&self, filepath: &Path, filename: &str) -> Option<ThreadView> {
-        let mtime = tokio::fs::metadata(filepath).await.ok()?.modified().ok()?;
-
+    async fn cached_thread_view(
+        &self,
+        filepath: &Path,
+        filename: &str,
+        mtime: SystemTime,
+    ) -> Option<ThreadView> {
         {
             let cache = self.inner.thread_scheduler_cache.lock_recover();
             if let Some(entry) = cache.get(filename)
@@ -1028,22 +1066,25 @@ impl MemoryWorker {
                 return None;
             }
         };
-        let session_data: session::Session = match serde_json::from_slice(&bytes) {
+        let session_data: ThreadSchedSource = match serde_json::from_slice(&bytes) {
             Ok(s) => s,
             Err(err) => {
                 tracing::warn!(file = %filename, error = %err, "cached_thread_view: parse failed");
                 return None;
             }
         };
-        let new_messages = thread_memory::filter_new_messages(
-            &session_data.messages,
-            &session_data.thread_memory_updated_at,
-        );
+        let new_message_count = session_data
+            .messages
+            .iter()
+            .filter(|m| {
+                thread_memory::is_new_since(&m.timestamp, &session_data.thread_memory_updated_at)
+            })
+            .count();
         let entry = ThreadSchedEntry {
             mtime,
-            persona: session_data.persona.clone(),
-            thread_memory_settings_override: session_data.thread_memory_settings.clone(),
-            new_message_count: new_messages.len() as u32,
+            persona: session_data.persona,
+            thread_memory_settings_override: session_data.thread_memory_settings,
+            new_message_count: new_message_count as u32,
         };
         let view = ThreadView {
             persona: entry.persona.clone(),
@@ -1112,23 +1153,23 @@ impl MemoryWorker {
                             continue;
                         }
                     };
-                    let data: session::Session = match serde_json::from_slice(&bytes) {
+                    let data: PersonaCountView = match serde_json::from_slice(&bytes) {
                         Ok(d) => d,
                         Err(err) => {
                             tracing::warn!(file = %filename, error = %err, "count_new_messages: parse failed");
                             continue;
                         }
                     };
-                    let mut ts: Vec<String> = Vec::new();
+                    let mut ts: Vec<String> = Vec::with_capacity(data.messages.len());
                     let mut missing: u32 = 0;
-                    for m in &data.messages {
+                    for m in data.messages {
                         if m.timestamp.is_empty() {
                             missing = missing.saturating_add(1);
                         } else {
-                            ts.push(m.timestamp.clone());
+                            ts.push(m.timestamp);
                         }
                     }
-                    let p = data.persona.clone();
+                    let p = data.persona;
                     let mo = data.mode;
                     self.inner.persona_count_cache.lock_recover().insert(
                         filename.clone(),
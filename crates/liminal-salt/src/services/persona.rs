@@ -7,11 +7,10 @@
 //! typed `Result<_, PersonaError>`.
 
 use std::{
+    collections::BTreeMap,
     path::{Path, PathBuf},
-    sync::LazyLock,
 };
 
-use regex::Regex;
 use serde::{Deserialize, Serialize};
 
 use crate::services::{memory, session};
@@ -20,13 +19,13 @@ use crate::services::{memory, session};
 // Validation
 // =============================================================================
 
-static PERSONA_NAME_RE: LazyLock<Regex> =
-    LazyLock::new(|| Regex::new(r"^[a-zA-Z0-9_]+$").expect("valid regex"));
-
-/// True iff the name is safe to use as a directory name. Alphanumeric plus
-/// underscore — matches Python's `_validate_persona_name`.
+/// True iff the name is safe to use as a directory name. ASCII alphanumeric
+/// plus underscore, 1–64 bytes — matches Python's `_validate_persona_name`.
+/// A byte loop rather than a regex: the charset is one table lookup per byte
+/// and any non-ASCII byte fails it, so no UTF-8 decoding is needed.
 pub fn valid_persona_name(name: &str) -> bool {
-    !name.is_empty() && name.len() <= 64 && PERSONA_NAME_RE.is_match(name)
+    (1..=64).contains(&name.len())
+        && name.bytes().all(|b| b.is_ascii_alphanumeric() || b == b'_')
 }
 
 // =============================================================================
@@ -114,12 +113,20 @@ pub struct PersonaSummary {
 /// All persona folders under `<data_dir>/personas/` that contain at least one
 /// `.md` file. Sorted alphabetically.
 pub async fn list_personas(data_dir: &Path) -> Vec<String> {
+    scan_personas(data_dir).await.into_keys().collect()
+}
+
+/// Every persona mapped to its first `.md` file (alpha order), in one pass
+/// over the personas dir plus one read per persona dir. Views that need both
+/// the persona list and a preview use this instead of `list_personas` +
+/// `get_preview`, which would list the selected persona's dir twice.
+pub async fn scan_personas(data_dir: &Path) -> BTreeMap<String, PathBuf> {
     let root = personas_dir(data_dir);
     let mut entries = match tokio::fs::read_dir(&root).await {
         Ok(e) => e,
-        Err(_) => return Vec::new(),
+        Err(_) => return BTreeMap::new(),
     };
-    let mut names = Vec::new();
+    let mut personas = BTreeMap::new();
     while let Ok(Some(entry)) = entries.next_entry().await {
         let Ok(ft) = entry.file_type().await else { continue };
         if !ft.is_dir() {
@@ -129,24 +136,31 @@ pub async fn list_personas(data_dir: &Path) -> Vec<String> {
         if !valid_persona_name(&name) {
             continue;
         }
-        if dir_has_markdown(&entry.path()).await {
-            names.push(name);
+        if let Some(md) = first_markdown(&entry.path()).await {
+            personas.insert(name, md);
         }
     }
-    names.sort();
-    names
+    personas
 }
 
-async fn dir_has_markdown(dir: &Path) -> bool {
-    let Ok(mut entries) = tokio::fs::read_dir(dir).await else {
-        return false;
-    };
+/// Alphabetically first `.md` regular file in `dir`.
+async fn first_markdown(dir: &Path) -> Option<PathBuf> {
+    let mut entries = tokio::fs::read_dir(dir).await.ok()?;
+    // Track only the winning name; the path is joined once at the end.
+    let mut first: Option<String> = None;
     while let Ok(Some(entry)) = entries.next_entry().await {
-        if entry.file_name().to_string_lossy().ends_with(".md") {
-            return true;
+        let fname = entry.file_name().to_string_lossy().into_owned();
+        if !fname.ends_with(".md") {
+            continue;
+        }
+        if first.as_deref().is_some_and(|existing| existing <= fname.as_str()) {
+            continue;
+        }
+        if is_file_entry(&entry).await {
+            first = Some(fname);
         }
     }
-    false
+    first.map(|name| dir.join(name))
 }
 
 pub async fn persona_exists(data_dir: &Path, name: &str) -> bool {
@@ -176,7 +190,7 @@ pub async fn load_identity(data_dir: &Path, name: &str) -> String {
     let mut files: Vec<(String, PathBuf)> = Vec::new();
     while let Ok(Some(entry)) = entries.next_entry().await {
         let name = entry.file_name().to_string_lossy().to_string();
-        if name.ends_with(".md") {
+        if name.ends_with(".md") && is_file_entry(&entry).await {
             files.push((name, entry.path()));
         }
     }
@@ -198,30 +212,31 @@ pub async fn get_preview(data_dir: &Path, name: &str) -> String {
     if !valid_persona_name(name) {
         return String::new();
     }
-    let dir = persona_dir(data_dir, name);
-    let Ok(mut entries) = tokio::fs::read_dir(&dir).await else {
-        return String::new();
-    };
-    let mut first: Option<PathBuf> = None;
-    let mut first_name: Option<String> = None;
-    while let Ok(Some(entry)) = entries.next_entry().await {
-        let fname = entry.file_name().to_string_lossy().to_string();
-        if !fname.ends_with(".md") {
-            continue;
-        }
-        if first_name
-            .as_deref()
-            .is_none_or(|existing| fname.as_str() < existing)
-        {
-            first_name = Some(fname.clone());
-            first = Some(entry.path());
-        }
+    match first_markdown(&persona_dir(data_dir, name)).await {
+        Some(path) => read_preview(&path).await,
+        None => String::new(),
     }
-    let Some(path) = first else {
-        return String::new();
-    };
-    tokio::fs::read_to_string(&path)
+}
+
+/// Regular-file check from the directory entry's own type info (`d_type` on
+/// Linux/macOS), so no extra `stat` per entry. Symlinks fall back to a stat.
+async fn is_file_entry(entry: &tokio::fs::DirEntry) -> bool {
+    match entry.file_type().await {
+        Ok(ft) if ft.is_symlink() => tokio::fs::metadata(entry.path())
+            .await
+            .is_ok_and(|m| m.is_file()),
+        Ok(ft) => ft.is_file(),
+        Err(_) => false,
+    }
+}
+
+/// Preview for an identity file already located by `scan_personas`. The
+/// persona page asks for the same preview on every GET, so it's read through
+/// the shared stamped cache.
+pub async fn read_preview(path: &Path) -> String {
+    crate::services::fs::read_to_string_cached(path)
         .await
+        .map(|body| body.to_string())
         .unwrap_or_default()
 }
 
@@ -266,11 +281,16 @@ pub async fn create_persona(
     if !valid_persona_name(name) {
         return Err(PersonaError::InvalidName);
     }
-    let dir = persona_dir(data_dir, name);
-    if tokio::fs::try_exists(&dir).await.unwrap_or(false) {
-        return Err(PersonaError::AlreadyExists);
+    // Non-recursive create of the leaf doubles as the existence check, so
+    // two concurrent creates can't both succeed.
+    tokio::fs::create_dir_all(personas_dir(data_dir)).await?;
+    match tokio::fs::create_dir(persona_dir(data_dir, name)).await {
+        Ok(()) => {}
+        Err(err) if err.kind() == std::io::ErrorKind::AlreadyExists => {
+            return Err(PersonaError::AlreadyExists);
+        }
+        Err(err) => return Err(PersonaError::Io(err)),
     }
-    tokio::fs::create_dir_all(&dir).await?;
     crate::services::fs::write_atomic(&identity_file(data_dir, name), identity_content.as_bytes()).await?;
     Ok(())
 }
@@ -281,14 +301,17 @@ pub async fn delete_persona(data_dir: &Path, name: &str) -> Result<(), PersonaEr
     if !valid_persona_name(name) {
         return Err(PersonaError::InvalidName);
     }
+    // No existence probe: the removal itself reports NotFound.
     let dir = persona_dir(data_dir, name);
-    if !tokio::fs::try_exists(&dir).await.unwrap_or(false) {
-        return Err(PersonaError::NotFound);
-    }
-
-    if let Err(err) = tokio::fs::remove_dir_all(&dir).await {
-        tracing::error!(persona = name, error = %err, "persona dir delete failed");
-        return Err(PersonaError::Io(err));
+    match tokio::fs::remove_dir_all(&dir).await {
+        Ok(()) => {}
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => {
+            return Err(PersonaError::NotFound);
+        }
+        Err(err) => {
+            tracing::error!(persona = name, error = %err, "persona dir delete failed");
+            return Err(PersonaError::Io(err));
+        }
     }
 
     // Cascade: memory file via its owning service.
@@ -296,10 +319,10 @@ pub async fn delete_persona(data_dir: &Path, name: &str) -> Result<(), PersonaEr
         tracing::warn!(persona = name, error = %err, "memory file delete failed");
     }
 
-    // Cascade: persona user-context dir.
+    // Cascade: persona user-context dir. Usually absent — NotFound is fine.
     let ctx = persona_user_context_dir(data_dir, name);
-    if tokio::fs::try_exists(&ctx).await.unwrap_or(false)
-        && let Err(err) = tokio::fs::remove_dir_all(&ctx).await
+    if let Err(err) = tokio::fs::remove_dir_all(&ctx).await
+        && err.kind() != std::io::ErrorKind::NotFound
     {
         tracing::warn!(persona = name, error = %err, "persona user-context delete failed");
     }
@@ -328,28 +351,41 @@ pub async fn rename_persona(
     }
     let old_dir = persona_dir(data_dir, old_name);
     let new_dir = persona_dir(data_dir, new_name);
-    if !tokio::fs::try_exists(&old_dir).await.unwrap_or(false) {
-        return Err(PersonaError::NotFound);
-    }
+    // rename(2) silently replaces an empty target dir, so the target still
+    // needs a probe; a missing source is reported by the rename itself.
     if tokio::fs::try_exists(&new_dir).await.unwrap_or(false) {
         return Err(PersonaError::AlreadyExists);
     }
 
     // Step 1: directory rename. Fatal if this fails.
-    tokio::fs::rename(&old_dir, &new_dir).await?;
+    match tokio::fs::rename(&old_dir, &new_dir).await {
+        Ok(()) => {}
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => {
+            return Err(PersonaError::NotFound);
+        }
+        Err(err)
+            if matches!(
+                err.kind(),
+                std::io::ErrorKind::AlreadyExists | std::io::ErrorKind::DirectoryNotEmpty
+            ) =>
+        {
+            return Err(PersonaError::AlreadyExists);
+        }
+        Err(err) => return Err(PersonaError::Io(err)),
+    }
 
     // Step 2: memory file via its owning service. Log and continue.
     if let Err(err) = memory::rename_memory(data_dir, old_name, new_name).await {
         tracing::warn!(old_name, new_name, error = %err, "memory rename failed");
     }
 
-    // Step 3: persona user-context dir.
+    // Step 3: persona user-context dir (if any — NotFound is fine).
     let old_ctx = persona_user_context_dir(data_dir, old_name);
-    if tokio::fs::try_exists(&old_ctx).await.unwrap_or(false) {
-        let new_ctx = persona_user_context_dir(data_dir, new_name);
-        if let Err(err) = tokio::fs::rename(&old_ctx, &new_ctx).await {
-            tracing::warn!(old_name, new_name, error = %err, "persona context rename failed");
-        }
+    let new_ctx = persona_user_context_dir(data_dir, new_name);
+    if let Err(err) = tokio::fs::rename(&old_ctx, &new_ctx).await
+        && err.kind() != std::io::ErrorKind::NotFound
+    {
+        tracing::warn!(old_name, new_name, error = %err, "persona context rename failed");
     }
 
     // Step 4: session file rewrite. session_manager already handles per-session locking.
@@ -10,7 +10,7 @@
 //! Persona memory writes live in `memory.rs`; this module only reads the
 //! resulting markdown through `memory::get_memory_content`.
 
-use std::path::Path;
+use std::{path::Path, sync::Arc};
 
 use crate::services::{
     context_files::ContextScope,
@@ -103,7 +103,7 @@ pub async fn build_system_prompt(data_dir: &Path, session: &Session) -> String {
     out.trim().to_string()
 }
 
-async fn collect_identity_files(persona_path: &Path) -> std::io::Result<Vec<(String, String)>> {
+async fn collect_identity_files(persona_path: &Path) -> std::io::Result<Vec<(String, Arc<str>)>> {
     let mut entries = tokio::fs::read_dir(persona_path).await?;
     let mut files = Vec::new();
     while let Some(entry) = entries.next_entry().await? {
@@ -111,7 +111,7 @@ async fn collect_identity_files(persona_path: &Path) -> std::io::Result<Vec<(Str
         if !name.ends_with(".md") {
             continue;
         }
-        let body = tokio::fs::read_to_string(entry.path()).await?;
+        let body = crate::services::fs::read_to_string_cached(&entry.path()).await?;
         files.push((name, body));
     }
     files.sort_by(|a, b| a.0.cmp(&b.0));
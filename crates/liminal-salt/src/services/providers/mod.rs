@@ -10,6 +10,8 @@
 
 pub mod openrouter;
 
+use std::sync::LazyLock;
+
 use crate::services::llm::{ChatLlm, LlmError, LlmMessage};
 
 /// Every provider the app knows how to dispatch to. Add a variant + match
@@ -42,6 +44,15 @@ pub fn metadata_list() -> Vec<ProviderMetadata> {
     ALL.iter().map(|p| p.metadata()).collect()
 }
 
+/// `metadata_list()` as JSON. The provider set is fixed at compile time, so
+/// this is serialized once per process rather than on every settings render.
+pub fn metadata_json() -> &'static str {
+    static JSON: LazyLock<String> = LazyLock::new(|| {
+        serde_json::to_string(&metadata_list()).unwrap_or_else(|_| "[]".to_string())
+    });
+    JSON.as_str()
+}
+
 impl Provider {
     pub fn id(&self) -> &'static str {
         match self {
@@ -70,7 +81,7 @@ impl Provider {
         &self,
         http: &reqwest::Client,
         api_key: &str,
-    ) -> Vec<openrouter::DisplayModel> {
+    ) -> std::sync::Arc<openrouter::ModelList> {
         match self {
             Provider::OpenRouter => openrouter::get_formatted_model_list(http, api_key).await,
         }
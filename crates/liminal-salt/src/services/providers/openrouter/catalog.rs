@@ -4,7 +4,12 @@
 //! tight, async-ChatLlm-shaped surface while the setup / settings flows get
 //! their own simple request→JSON helpers.
 
-use std::time::Duration;
+use std::{
+    collections::{BTreeMap, HashMap},
+    hash::{BuildHasher, RandomState},
+    sync::{Arc, LazyLock, Mutex as StdMutex},
+    time::{Duration, Instant},
+};
 
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
@@ -12,6 +17,9 @@ use serde::{Deserialize, Serialize};
 const OPENROUTER_AUTH_URL: &str = "https://openrouter.ai/api/v1/auth/key";
 const OPENROUTER_MODELS_URL: &str = "https://openrouter.ai/api/v1/models";
 const NETWORK_TIMEOUT: Duration = Duration::from_secs(10);
+/// How long a formatted catalog stays fresh. The settings page and setup
+/// step 2 both hit this on every render; OpenRouter's list changes slowly.
+const MODELS_CACHE_TTL: Duration = Duration::from_secs(5 * 60);
 
 // =============================================================================
 // Types
@@ -42,6 +50,32 @@ pub struct DisplayModel {
     pub display: String,
 }
 
+/// A formatted catalog plus its JSON encoding, computed together once per
+/// fetch. Views embed or return the JSON as-is instead of re-serializing
+/// several hundred entries on every render.
+#[derive(Debug)]
+pub struct ModelList {
+    pub models: Vec<DisplayModel>,
+    pub json: String,
+}
+
+impl ModelList {
+    pub fn new(models: Vec<DisplayModel>) -> Self {
+        let json = serde_json::to_string(&models).unwrap_or_else(|_| "[]".to_string());
+        Self { models, json }
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.models.is_empty()
+    }
+}
+
+impl Default for ModelList {
+    fn default() -> Self {
+        Self::new(Vec::new())
+    }
+}
+
 // =============================================================================
 // API calls
 // =============================================================================
@@ -65,6 +99,8 @@ pub async fn validate_api_key(http: &Client, api_key: &str) -> bool {
         }
         Ok(resp) => {
             tracing::error!(status = %resp.status(), "API key validation failed");
+            // A rejected key must not keep serving its catalog from cache.
+            forget_models(api_key);
             false
         }
         Err(err) => {
@@ -78,16 +114,34 @@ pub async fn validate_api_key(http: &Client, api_key: &str) -> bool {
 /// can surface a generic "couldn't fetch" message instead of leaking HTTP
 /// internals.
 pub async fn fetch_available_models(http: &Client, api_key: &str) -> Option<Vec<Model>> {
+    match fetch_catalog(http, api_key, None).await? {
+        Fetched::Models { models, .. } => Some(models),
+        // Only possible in answer to If-None-Match, which we didn't send.
+        Fetched::NotModified => None,
+    }
+}
+
+enum Fetched {
+    Models { models: Vec<Model>, etag: Option<String> },
+    NotModified,
+}
+
+/// `/models`, conditional on `etag` when one is known. A 304 means the
+/// cached catalog is still current and skips the download and the format pass.
+async fn fetch_catalog(http: &Client, api_key: &str, etag: Option<&str>) -> Option<Fetched> {
     #[derive(Deserialize)]
     struct ModelsResponse {
         #[serde(default)]
         data: Vec<Model>,
     }
 
-    let request = http
+    let mut request = http
         .get(OPENROUTER_MODELS_URL)
         .bearer_auth(api_key)
         .timeout(NETWORK_TIMEOUT);
+    if let Some(etag) = etag {
+        request = request.header(reqwest::header::IF_NONE_MATCH, etag);
+    }
     let resp = match request.send().await {
         Ok(r) => r,
         Err(err) => {
@@ -95,14 +149,25 @@ pub async fn fetch_available_models(http: &Client, api_key: &str) -> Option<Vec<
             return None;
         }
     };
+    if etag.is_some() && resp.status() == reqwest::StatusCode::NOT_MODIFIED {
+        return Some(Fetched::NotModified);
+    }
     if !resp.status().is_success() {
         tracing::error!(status = %resp.status(), "OpenRouter /models returned non-success");
         return None;
     }
+    let etag = resp
+        .headers()
+        .get(reqwest::header::ETAG)
+        .and_then(|v| v.to_str().ok())
+        .map(str::to_string);
     match resp.json::<ModelsResponse>().await {
         Ok(body) => {
             tracing::info!(count = body.data.len(), "fetched OpenRouter models");
-            Some(body.data)
+            Some(Fetched::Models {
+                models: body.data,
+                etag,
+            })
         }
         Err(err) => {
             tracing::error!(error = %err, "failed to parse OpenRouter /models response");
@@ -135,26 +200,115 @@ pub fn format_model_pricing(pricing: Option<&ModelPricing>) -> String {
 
 /// One-shot "fetch and prepare for display". Empty key or network failure →
 /// empty list, so the UI shows a clean "no models available" state.
-pub async fn get_formatted_model_list(http: &Client, api_key: &str) -> Vec<DisplayModel> {
+///
+/// Successful results are cached per API key for `MODELS_CACHE_TTL`, so
+/// repeated page renders skip both the `/models` round-trip and the
+/// group/sort/format pass. An expired entry is revalidated with its ETag,
+/// so an unchanged catalog costs a 304 rather than a full download. Failures
+/// are never cached; if a refresh fails, the last good list for the key is
+/// served instead (stale-on-error). The list is shared — a cache hit is a
+/// refcount bump, not a copy of several hundred entries.
+pub async fn get_formatted_model_list(http: &Client, api_key: &str) -> Arc<ModelList> {
     if api_key.is_empty() {
-        return Vec::new();
+        return Arc::default();
     }
-    let Some(models) = fetch_available_models(http, api_key).await else {
-        return Vec::new();
+    let previous = match cached_models(api_key) {
+        Some(CacheHit::Fresh(hit)) => return hit,
+        Some(CacheHit::Stale { models, etag }) => Some((models, etag)),
+        None => None,
     };
-    format_models(&models)
+    let etag = previous.as_ref().and_then(|(_, etag)| etag.as_deref());
+    match fetch_catalog(http, api_key, etag).await {
+        Some(Fetched::Models { models, etag }) => {
+            let formatted = Arc::new(ModelList::new(format_models(&models)));
+            store_models(api_key, Arc::clone(&formatted), etag);
+            formatted
+        }
+        Some(Fetched::NotModified) => {
+            let (models, etag) = previous.unwrap_or_default();
+            store_models(api_key, Arc::clone(&models), etag);
+            models
+        }
+        None => {
+            if previous.is_some() {
+                tracing::warn!("model catalog refresh failed; serving the previous list");
+            }
+            previous.map(|(models, _)| models).unwrap_or_default()
+        }
+    }
+}
+
+// =============================================================================
+// Catalog cache
+// =============================================================================
+
+/// Keyed by a per-process SipHash of the API key rather than the key itself,
+/// so the map never retains the secret. Entries outlive their TTL — an
+/// expired entry is the fallback when a refresh fails — and are dropped only
+/// when replaced or when the key is rejected.
+static MODELS_CACHE: LazyLock<StdMutex<HashMap<u64, CachedCatalog>>> =
+    LazyLock::new(|| StdMutex::new(HashMap::new()));
+
+struct CachedCatalog {
+    fetched_at: Instant,
+    etag: Option<String>,
+    models: Arc<ModelList>,
+}
+
+/// Randomly seeded once per process, so cache keys can't be precomputed.
+static KEY_HASHER: LazyLock<RandomState> = LazyLock::new(RandomState::new);
+
+fn cache_key(api_key: &str) -> u64 {
+    KEY_HASHER.hash_one(api_key)
+}
+
+enum CacheHit {
+    Fresh(Arc<ModelList>),
+    Stale {
+        models: Arc<ModelList>,
+        etag: Option<String>,
+    },
+}
+
+fn cached_models(api_key: &str) -> Option<CacheHit> {
+    let cache = MODELS_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    let entry = cache.get(&cache_key(api_key))?;
+    let models = Arc::clone(&entry.models);
+    Some(if entry.fetched_at.elapsed() < MODELS_CACHE_TTL {
+        CacheHit::Fresh(models)
+    } else {
+        CacheHit::Stale {
+            models,
+            etag: entry.etag.clone(),
+        }
+    })
+}
+
+fn forget_models(api_key: &str) {
+    let mut cache = MODELS_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.remove(&cache_key(api_key));
+}
+
+fn store_models(api_key: &str, models: Arc<ModelList>, etag: Option<String>) {
+    let mut cache = MODELS_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.insert(
+        cache_key(api_key),
+        CachedCatalog {
+            fetched_at: Instant::now(),
+            etag,
+            models,
+        },
+    );
 }
 
 /// Group by provider (slash-prefix of model id), sort providers alphabetically,
 /// sort models within each group by name, then flatten back into a single
 /// list with `Provider: Name - $X/$Y` display strings.
 fn format_models(models: &[Model]) -> Vec<DisplayModel> {
-    use std::collections::BTreeMap;
-
-    let mut groups: BTreeMap<String, Vec<&Model>> = BTreeMap::new();
+    let mut groups: BTreeMap<&str, Vec<&Model>> = BTreeMap::new();
     for m in models {
         let provider = m.id.split_once('/').map(|(p, _)| p).unwrap_or("Other");
-        groups.entry(provider.to_string()).or_default().push(m);
+        groups.entry(provider).or_default().push(m);
     }
 
     let mut out = Vec::with_capacity(models.len());
@@ -172,9 +326,10 @@ fn format_models(models: &[Model]) -> Vec<DisplayModel> {
             })
             .collect::<Vec<_>>()
             .join(" ");
+        let provider_lower = provider.to_lowercase();
 
         for m in items {
-            let name = if m.name.to_lowercase().starts_with(&provider.to_lowercase()) {
+            let name = if m.name.to_lowercase().starts_with(&provider_lower) {
                 m.name.clone()
             } else {
                 format!("{}: {}", provider_display, m.name)
@@ -267,6 +422,24 @@ mod tests {
         assert_eq!(out[0].display, "Openai: GPT-4 - Free");
     }
 
+    #[test]
+    fn model_cache_is_keyed_by_api_key() {
+        let models = vec![DisplayModel {
+            id: "openai/gpt-4".into(),
+            display: "Openai: GPT-4".into(),
+        }];
+        store_models("sk-test-cache-a", Arc::new(ModelList::new(models)), None);
+        let Some(CacheHit::Fresh(hit)) = cached_models("sk-test-cache-a") else {
+            panic!("expected a fresh entry");
+        };
+        assert_eq!(hit.models[0].id, "openai/gpt-4");
+        assert!(hit.json.starts_with(r#"[{"id":"openai/gpt-4""#));
+        assert!(cached_models("sk-test-cache-b").is_none());
+
+        forget_models("sk-test-cache-a");
+        assert!(cached_models("sk-test-cache-a").is_none());
+    }
+
     #[test]
     fn format_models_unknown_provider_goes_to_other() {
         let models = vec![Model {
@@ -31,10 +31,16 @@ impl ChatLlm for LlmClient {
 
 impl LlmClient {
     pub fn new(api_key: impl Into<String>, model: impl Into<String>) -> Self {
+        Self::with_client(Client::new(), api_key.into(), model.into())
+    }
+
+    /// The one place the struct is assembled, so `new` and `from_config`
+    /// share defaults (the request timeout).
+    fn with_client(client: Client, api_key: String, model: String) -> Self {
         Self {
-            api_key: api_key.into(),
-            model: model.into(),
-            client: Client::new(),
+            api_key,
+            model,
+            client,
             timeout: Duration::from_secs(30),
         }
     }
@@ -54,8 +60,11 @@ impl LlmClient {
     /// Convenience constructor that wires a config-derived `LlmClient` to the
     /// app's shared `reqwest::Client`. Handlers must use this rather than
     /// `LlmClient::new` directly (CLAUDE.md "Handlers do not do work").
+    ///
+    /// Skips `new`: `Client::new()` sets up a fresh TLS config and connection
+    /// pool, which would be thrown away immediately on every chat turn.
     pub fn from_config(http: &Client, api_key: &str, model: &str) -> Self {
-        Self::new(api_key, model).with_http_client(http.clone())
+        Self::with_client(http.clone(), api_key.to_string(), model.to_string())
     }
 
     pub async fn call_llm(&self, messages: &[LlmMessage]) -> Result<String, LlmError> {
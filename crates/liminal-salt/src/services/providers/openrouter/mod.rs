@@ -7,6 +7,6 @@ pub mod chat;
 // Re-export catalog's public surface so callers can reach it as
 // `providers::openrouter::<name>` without the `::catalog::` hop.
 pub use catalog::{
-    DisplayModel, Model, ModelPricing, fetch_available_models, format_model_pricing,
+    DisplayModel, Model, ModelList, ModelPricing, fetch_available_models, format_model_pricing,
     get_formatted_model_list, validate_api_key,
 };
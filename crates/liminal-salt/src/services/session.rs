@@ -12,7 +12,7 @@
 //!   access; invalid IDs short-circuit to `None` / no-op without panicking.
 
 use std::{
-    collections::HashMap,
+    collections::{HashMap, HashSet},
     path::{Path, PathBuf},
     sync::{Arc, LazyLock, Mutex as StdMutex},
 };
@@ -20,13 +20,15 @@ use std::{
 use chrono::{SecondsFormat, Utc};
 use regex::Regex;
 use serde::{Deserialize, Serialize};
-use tokio::sync::Mutex as TokioMutex;
+use tokio::{sync::Mutex as TokioMutex, task::JoinSet};
+
+use crate::services::fs::{FileStamp, file_stamp};
 
 // =============================================================================
 // Types
 // =============================================================================
 
-#[derive(Clone, Copy, Debug, Default, Deserialize, Serialize, PartialEq, Eq)]
+#[derive(Clone, Copy, Debug, Default, Deserialize, Serialize, PartialEq, Eq, Hash)]
 #[serde(rename_all = "lowercase")]
 pub enum Mode {
     #[default]
@@ -108,7 +110,9 @@ impl Session {
 
 /// Lightweight summary used by the sidebar listing; reads a session file without
 /// acquiring the per-session lock (matches Python's `get_sessions_with_titles`).
-#[derive(Clone, Debug, Serialize)]
+/// `Hash` covers exactly what the sidebar shows, so views can fold a listing
+/// into their ETag.
+#[derive(Clone, Debug, Serialize, Hash)]
 pub struct SessionSummary {
     pub id: String,
     pub title: String,
@@ -162,10 +166,44 @@ pub fn now_timestamp() -> String {
 
 /// Generate a new session filename. UTC-based (Python uses local time; using UTC
 /// keeps filenames monotonic across timezones).
-pub fn generate_session_id() -> String {
-    format!("session_{}.json", Utc::now().format("%Y%m%d_%H%M%S"))
+///
+/// Timestamps only have second precision, so two ids issued in the same second
+/// get a zero-padded `_NNN` sequence suffix (`session_20260421_120000_001.json`)
+/// and still sort newest-first. The in-process sequence covers ids issued but
+/// not yet written; the existence check covers files left by an earlier run
+/// (a restart within the same second) or another process.
+pub async fn generate_session_id(sessions_dir: &Path) -> String {
+    loop {
+        let id = next_session_id();
+        let taken = tokio::fs::try_exists(session_path(sessions_dir, &id))
+            .await
+            .unwrap_or(false);
+        if !taken {
+            return id;
+        }
+    }
+}
+
+fn next_session_id() -> String {
+    let stamp = Utc::now().format("%Y%m%d_%H%M%S").to_string();
+    let mut last = LAST_ISSUED_ID.lock().unwrap_or_else(|e| e.into_inner());
+    let seq = match &*last {
+        (prev, n) if *prev == stamp => n + 1,
+        _ => 0,
+    };
+    let id = if seq == 0 {
+        format!("session_{stamp}.json")
+    } else {
+        format!("session_{stamp}_{seq:03}.json")
+    };
+    *last = (stamp, seq);
+    id
 }
 
+/// `(timestamp, sequence)` of the most recently issued session id.
+static LAST_ISSUED_ID: LazyLock<StdMutex<(String, u32)>> =
+    LazyLock::new(|| StdMutex::new((String::new(), 0)));
+
 static SESSION_ID_RE: LazyLock<Regex> = LazyLock::new(|| {
     Regex::new(r"^session_\d{8}_\d{6}(?:_\d+)?\.json$").expect("valid regex")
 });
@@ -218,11 +256,29 @@ async fn read_session(path: &Path, session_id: &str) -> Result<Session, SessionE
 }
 
 async fn write_session(path: &Path, session: &Session) -> std::io::Result<()> {
-    let bytes = serde_json::to_vec_pretty(session)
+    // Size the buffer up front: message bodies dominate the file, so starting
+    // from their total length avoids regrowing (and re-copying) a long thread
+    // several times per save.
+    let mut bytes = Vec::with_capacity(estimated_json_len(session));
+    serde_json::to_writer_pretty(&mut bytes, session)
         .map_err(|e| std::io::Error::new(std::io::ErrorKind::InvalidData, e))?;
     crate::services::fs::write_atomic(path, &bytes).await
 }
 
+/// Rough pretty-printed size: content + per-message keys/indentation/timestamp.
+fn estimated_json_len(session: &Session) -> usize {
+    const PER_MESSAGE_OVERHEAD: usize = 128;
+    let messages: usize = session
+        .messages
+        .iter()
+        .map(|m| m.content.len() + PER_MESSAGE_OVERHEAD)
+        .sum();
+    let extras = session.draft.as_deref().map_or(0, str::len)
+        + session.scenario.as_deref().map_or(0, str::len)
+        + session.thread_memory.len();
+    messages + extras + 512
+}
+
 // =============================================================================
 // Public reads
 // =============================================================================
@@ -239,13 +295,51 @@ pub async fn load_session(
     read_session(&session_path(sessions_dir, session_id), session_id).await
 }
 
+/// Load just `(thread_memory, thread_memory_updated_at)`. The thread-memory
+/// status endpoint is polled while an update runs, so it skips materializing
+/// the message history that `load_session` would allocate on every poll.
+pub async fn load_thread_memory(
+    sessions_dir: &Path,
+    session_id: &str,
+) -> Result<(String, String), SessionError> {
+    if !valid_session_id(session_id) {
+        return Err(SessionError::InvalidId(session_id.to_string()));
+    }
+    let lock = get_session_lock(session_id);
+    let _guard = lock.lock().await;
+    let bytes = match tokio::fs::read(session_path(sessions_dir, session_id)).await {
+        Ok(b) => b,
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => {
+            return Err(SessionError::NotFound(session_id.to_string()));
+        }
+        Err(err) => return Err(SessionError::Io(err)),
+    };
+    let view = serde_json::from_slice::<ThreadMemoryView>(&bytes)?;
+    Ok((view.thread_memory, view.thread_memory_updated_at))
+}
+
+#[derive(Deserialize)]
+struct ThreadMemoryView {
+    #[serde(default)]
+    thread_memory: String,
+    #[serde(default)]
+    thread_memory_updated_at: String,
+}
+
 /// List all sessions in the directory. Doesn't acquire per-session locks —
 /// matches Python's `get_sessions_with_titles()`; a brief stale read during
 /// concurrent writes is acceptable for sidebar display.
+///
+/// Every chat render lists the sidebar, so summaries are kept in
+/// `SUMMARY_CACHE` and a file is only re-read when its `FileStamp` moved.
+/// Each entry is still stat'ed on every listing: the directory's own mtime
+/// is too coarse to vouch for in-place rewrites of the files inside it.
 pub async fn list_sessions(sessions_dir: &Path) -> Vec<SessionSummary> {
-    let _ = tokio::fs::create_dir_all(sessions_dir).await;
+    // `main` creates the directory at startup; a missing one just means no
+    // sessions rather than something to recreate on every listing.
     let mut entries = match tokio::fs::read_dir(sessions_dir).await {
         Ok(e) => e,
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => return Vec::new(),
         Err(err) => {
             tracing::error!(?sessions_dir, error = %err, "list_sessions: read_dir failed");
             return Vec::new();
@@ -253,20 +347,59 @@ pub async fn list_sessions(sessions_dir: &Path) -> Vec<SessionSummary> {
     };
 
     let mut summaries: Vec<SessionSummary> = Vec::new();
+    let mut seen: HashSet<PathBuf> = HashSet::new();
+    let mut misses: Vec<(String, PathBuf, Option<FileStamp>)> = Vec::new();
     while let Ok(Some(entry)) = entries.next_entry().await {
         let filename = entry.file_name().to_string_lossy().to_string();
         if !filename.ends_with(".json") {
             continue;
         }
         let path = entry.path();
-        match read_session(&path, &filename).await {
-            Ok(s) => summaries.push(SessionSummary {
-                id: filename,
-                title: s.title,
-                persona: s.persona,
-                pinned: s.pinned.unwrap_or(false),
-                mode: s.mode,
-            }),
+        let stamp = entry.metadata().await.ok().map(|meta| file_stamp(&meta));
+        if let Some(stamp) = stamp
+            && let Some(hit) = cached_summary(&path, stamp)
+        {
+            summaries.push(hit);
+            seen.insert(path);
+            continue;
+        }
+        misses.push((filename, path, stamp));
+    }
+
+    // Cold listings (first render, or after many writes) read the changed
+    // files concurrently, a bounded number at a time, rather than one
+    // open + parse after another.
+    let mut misses = misses.into_iter();
+    let mut reads = JoinSet::new();
+    for miss in misses.by_ref().take(HEAD_READ_CONCURRENCY) {
+        reads.spawn(read_summary(miss));
+    }
+    while let Some(joined) = reads.join_next().await {
+        if let Some(miss) = misses.next() {
+            reads.spawn(read_summary(miss));
+        }
+        let (filename, path, stamp, head) = match joined {
+            Ok(read) => read,
+            Err(err) => {
+                tracing::error!(error = %err, "list_sessions: read task failed");
+                continue;
+            }
+        };
+        match head {
+            Ok(s) => {
+                let summary = SessionSummary {
+                    id: filename,
+                    title: s.title,
+                    persona: s.persona,
+                    pinned: s.pinned.unwrap_or(false),
+                    mode: s.mode,
+                };
+                if let Some(stamp) = stamp {
+                    store_summary(&path, stamp, &summary);
+                }
+                summaries.push(summary);
+                seen.insert(path);
+            }
             Err(err) => {
                 tracing::error!(id = %filename, error = %err, "list_sessions: read failed");
                 summaries.push(SessionSummary {
@@ -280,10 +413,42 @@ pub async fn list_sessions(sessions_dir: &Path) -> Vec<SessionSummary> {
         }
     }
 
+    prune_summaries(sessions_dir, &seen);
     summaries.sort_by(|a, b| b.id.cmp(&a.id));
     summaries
 }
 
+/// The top-level fields a sidebar summary needs. Deserializing into this
+/// instead of `Session` lets serde skip the `messages` array — usually
+/// nearly all of the file — without allocating any of it.
+#[derive(Deserialize)]
+struct SessionHead {
+    title: String,
+    persona: String,
+    #[serde(default)]
+    pinned: Option<bool>,
+    #[serde(default)]
+    mode: Mode,
+}
+
+async fn read_session_head(path: &Path) -> Result<SessionHead, SessionError> {
+    let bytes = tokio::fs::read(path).await?;
+    Ok(serde_json::from_slice::<SessionHead>(&bytes)?)
+}
+
+/// Upper bound on session files `list_sessions` reads at once on a cold
+/// listing.
+const HEAD_READ_CONCURRENCY: usize = 8;
+
+type SummaryRead = (String, PathBuf, Option<FileStamp>, Result<SessionHead, SessionError>);
+
+async fn read_summary(
+    (filename, path, stamp): (String, PathBuf, Option<FileStamp>),
+) -> SummaryRead {
+    let head = read_session_head(&path).await;
+    (filename, path, stamp, head)
+}
+
 /// Aggregate messages from sessions that match a persona, newest session first.
 /// Skips roleplay sessions — those don't feed cross-thread persona memory.
 ///
@@ -309,31 +474,36 @@ pub async fn list_persona_threads(
         }
     };
 
-    // Collect (path, mtime) so we can sort newest-first before reading bodies.
-    let mut files: Vec<(PathBuf, std::time::SystemTime)> = Vec::new();
+    // Collect (path, stamp) so we can sort newest-first before reading bodies.
+    let mut files: Vec<(PathBuf, FileStamp)> = Vec::new();
     while let Ok(Some(entry)) = entries.next_entry().await {
         let filename = entry.file_name().to_string_lossy().to_string();
         if !filename.ends_with(".json") {
             continue;
         }
         let Ok(meta) = entry.metadata().await else { continue };
-        let Ok(mtime) = meta.modified() else { continue };
-        files.push((entry.path(), mtime));
+        if meta.modified().is_err() {
+            continue;
+        }
+        files.push((entry.path(), file_stamp(&meta)));
     }
-    files.sort_by_key(|(_, mtime)| std::cmp::Reverse(*mtime));
+    files.sort_by_key(|(_, (mtime, _))| std::cmp::Reverse(*mtime));
 
     if let Some(cap) = max_threads {
         files.truncate(cap);
     }
 
     let mut threads = Vec::new();
-    for (path, _) in files {
-        let filename = path
-            .file_name()
-            .and_then(|s| s.to_str())
-            .unwrap_or("")
-            .to_string();
-        let Ok(session) = read_session(&path, &filename).await else {
+    for (path, stamp) in files {
+        // The sidebar cache already knows the persona and mode of any file
+        // that hasn't changed since it was listed; skip reading the ones it
+        // rules out.
+        if cached_summary(&path, stamp)
+            .is_some_and(|s| s.persona != persona || s.mode == Mode::Roleplay)
+        {
+            continue;
+        }
+        let Ok(session) = read_thread_source(&path).await else {
             continue;
         };
         if session.persona != persona {
@@ -361,6 +531,51 @@ pub async fn list_persona_threads(
     threads
 }
 
+/// The fields `list_persona_threads` keeps. Skipping the rest of `Session`
+/// means a thread's draft, scenario and thread memory — the latter up to
+/// several KB of summary per file — are never allocated during aggregation.
+#[derive(Deserialize)]
+struct ThreadSource {
+    title: String,
+    persona: String,
+    #[serde(default)]
+    mode: Mode,
+    #[serde(default)]
+    messages: Vec<Message>,
+}
+
+async fn read_thread_source(path: &Path) -> Result<ThreadSource, SessionError> {
+    let bytes = tokio::fs::read(path).await?;
+    Ok(serde_json::from_slice::<ThreadSource>(&bytes)?)
+}
+
+// =============================================================================
+// Sidebar cache — per-file summaries by file stamp
+// =============================================================================
+
+static SUMMARY_CACHE: LazyLock<StdMutex<HashMap<PathBuf, (FileStamp, SessionSummary)>>> =
+    LazyLock::new(|| StdMutex::new(HashMap::new()));
+
+fn cached_summary(path: &Path, stamp: FileStamp) -> Option<SessionSummary> {
+    let cache = SUMMARY_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    match cache.get(path) {
+        Some((cached_stamp, summary)) if *cached_stamp == stamp => Some(summary.clone()),
+        _ => None,
+    }
+}
+
+fn store_summary(path: &Path, stamp: FileStamp, summary: &SessionSummary) {
+    let mut cache = SUMMARY_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.insert(path.to_path_buf(), (stamp, summary.clone()));
+}
+
+/// Drop entries for files in `sessions_dir` that the last listing didn't see
+/// (deleted sessions), so the cache doesn't grow without bound.
+fn prune_summaries(sessions_dir: &Path, seen: &HashSet<PathBuf>) {
+    let mut cache = SUMMARY_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.retain(|path, _| path.parent() != Some(sessions_dir) || seen.contains(path));
+}
+
 // =============================================================================
 // Public writes (each acquires the per-session lock)
 // =============================================================================
@@ -422,6 +637,10 @@ pub async fn delete_session(sessions_dir: &Path, session_id: &str) -> Result<(),
 /// thread_memory_updated_at, thread_memory_settings, pinned, draft, and
 /// title_locked intact unless explicitly overwritten. If the session file is
 /// missing, a fresh one is written.
+///
+/// A locked title on disk wins over `title` unless the caller is setting the
+/// lock itself: the caller's title comes from a load that may predate a
+/// rename made while the LLM was answering.
 pub async fn save_chat_history(
     sessions_dir: &Path,
     session_id: &str,
@@ -429,6 +648,7 @@ pub async fn save_chat_history(
     persona: &str,
     messages: Vec<Message>,
     title_locked: Option<bool>,
+    clear_draft: bool,
 ) -> Result<(), SessionError> {
     if !valid_session_id(session_id) {
         return Err(SessionError::InvalidId(session_id.to_string()));
@@ -441,12 +661,17 @@ pub async fn save_chat_history(
         Err(SessionError::NotFound(_)) => Session::blank(),
         Err(err) => return Err(err),
     };
-    session.title = title.to_string();
+    if title_locked.is_some() || !session.title_locked.unwrap_or(false) {
+        session.title = title.to_string();
+    }
     session.persona = persona.to_string();
     session.messages = messages;
     if let Some(locked) = title_locked {
         session.title_locked = Some(locked);
     }
+    if clear_draft && session.draft.is_some() {
+        session.draft = Some(String::new());
+    }
     write_session(&path, &session).await?;
     Ok(())
 }
@@ -486,6 +711,30 @@ pub async fn rename_session(
     Ok(())
 }
 
+/// Apply an auto-generated title unless the title is already locked (a
+/// rename, or an earlier generation, got there first). Locks it on success.
+/// Returns whether the title was applied.
+pub async fn set_generated_title(
+    sessions_dir: &Path,
+    session_id: &str,
+    title: &str,
+) -> Result<bool, SessionError> {
+    if !valid_session_id(session_id) {
+        return Err(SessionError::InvalidId(session_id.to_string()));
+    }
+    let lock = get_session_lock(session_id);
+    let _guard = lock.lock().await;
+    let path = session_path(sessions_dir, session_id);
+    let mut session = read_session(&path, session_id).await?;
+    if session.title_locked.unwrap_or(false) {
+        return Ok(false);
+    }
+    session.title = title.to_string();
+    session.title_locked = Some(true);
+    write_session(&path, &session).await?;
+    Ok(true)
+}
+
 pub async fn save_draft(
     sessions_dir: &Path,
     session_id: &str,
@@ -679,21 +928,40 @@ pub async fn update_persona_across_sessions(
         }
     };
 
+    // The persona value as it appears in the file. A session that doesn't
+    // contain this text can't reference the persona, so it's skipped
+    // without a JSON parse.
+    let needle = serde_json::to_string(old_name).unwrap_or_default();
+
     while let Ok(Some(entry)) = entries.next_entry().await {
-        let filename = entry.file_name().to_string_lossy().to_string();
-        if !filename.ends_with(".json") {
+        let filename = entry.file_name().to_string_lossy().into_owned();
+        // Only real session files — stray JSON (backups, hand-copied files)
+        // is skipped before we register a lock for it.
+        if !valid_session_id(&filename) {
             continue;
         }
         let path = entry.path();
         let lock = get_session_lock(&filename);
         let _guard = lock.lock().await;
-        let mut session = match read_session(&path, &filename).await {
-            Ok(s) => s,
+        // Read as text: the UTF-8 check is one pass, then `str::contains`
+        // (linear-time substring search) and `from_str` both reuse it.
+        let text = match tokio::fs::read_to_string(&path).await {
+            Ok(t) => t,
             Err(err) => {
                 tracing::warn!(session_id = %filename, error = %err, "update_persona_across_sessions: read failed, skipping");
                 continue;
             }
         };
+        if !text.contains(needle.as_str()) {
+            continue;
+        }
+        let mut session = match serde_json::from_str::<Session>(&text) {
+            Ok(s) => s,
+            Err(err) => {
+                tracing::warn!(session_id = %filename, error = %err, "update_persona_across_sessions: parse failed, skipping");
+                continue;
+            }
+        };
         if session.persona != old_name {
             continue;
         }
@@ -725,33 +993,8 @@ pub async fn fork_to_roleplay(
         .await?
     };
 
-    // Generate a collision-free id. Second-precision timestamps can collide if
-    // the user forked twice in the same second.
-    let mut new_id = generate_session_id();
-    if new_id == source_session_id
-        || tokio::fs::try_exists(&session_path(sessions_dir, &new_id))
-            .await
-            .unwrap_or(false)
-    {
-        let base = new_id.trim_end_matches(".json").to_string();
-        let mut found = None;
-        for i in 1..100 {
-            let candidate = format!("{base}_{i}.json");
-            if candidate == source_session_id {
-                continue;
-            }
-            if !tokio::fs::try_exists(&session_path(sessions_dir, &candidate))
-                .await
-                .unwrap_or(false)
-            {
-                found = Some(candidate);
-                break;
-            }
-        }
-        new_id = found.ok_or(SessionError::InvalidState(
-            "no collision-free id in 100 attempts",
-        ))?;
-    }
+    // `generate_session_id` skips ids already on disk, the source included.
+    let new_id = generate_session_id(sessions_dir).await;
 
     let new_session = Session {
         title: "New Chat".to_string(),
@@ -1,6 +1,10 @@
 //! Title generation — one-shot LLM call to turn the first exchange into a 2–5
 //! word session title. Ports `chat/services/summarizer.py` semantics faithfully.
 
+use std::sync::LazyLock;
+
+use regex::Regex;
+
 use crate::services::llm::{ChatLlm, LlmMessage};
 use crate::services::session::Role;
 
@@ -14,7 +18,11 @@ const ARTIFACTS: &[&str] = &[
     "###",
     "Prompt",
 ];
-const BAD_PATTERNS: &[&str] = &["[", "]", "<", ">", "#", "\n", "Prompt", "INST", "SYS"];
+/// Anything that marks a title as leaked model scaffolding: `[`, `]`, `<`,
+/// `>`, `#`, newline, or the literal words `Prompt` / `INST` / `SYS`. One
+/// compiled pattern, one scan — instead of nine `contains` passes.
+static BAD_PATTERN_RE: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r"[\[\]<>#\n]|Prompt|INST|SYS").expect("valid regex"));
 
 /// Generate a 2–5 word title from the first user + assistant exchange. Falls
 /// back to a truncated user prompt if the LLM response is missing, malformed,
@@ -97,7 +105,7 @@ fn clean_title(title: &str) -> String {
 }
 
 fn has_artifacts(title: &str) -> bool {
-    BAD_PATTERNS.iter().any(|p| title.contains(p))
+    BAD_PATTERN_RE.is_match(title)
 }
 
 fn fallback(user_prompt: &str) -> String {
@@ -124,6 +132,9 @@ mod tests {
         assert!(has_artifacts("[INST] bad"));
         assert!(has_artifacts("has #hash"));
         assert!(has_artifacts("has\nnewline"));
+        assert!(has_artifacts("a <tag>"));
+        assert!(has_artifacts("SYS note"));
+        assert!(has_artifacts("My Prompt"));
         assert!(!has_artifacts("Clean Title"));
     }
 
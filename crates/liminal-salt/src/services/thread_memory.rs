@@ -101,13 +101,19 @@ pub fn filter_new_messages(messages: &[Message], updated_at: &str) -> Vec<Messag
         if m.timestamp.is_empty() {
             tracing::warn!("filter_new_messages: message without timestamp, including as new");
             out.push(m.clone());
-        } else if m.timestamp.as_str() > updated_at {
+        } else if is_new_since(&m.timestamp, updated_at) {
             out.push(m.clone());
         }
     }
     out
 }
 
+/// The per-message rule behind `filter_new_messages`, for callers that only
+/// need a count and have the timestamps without the messages.
+pub fn is_new_since(timestamp: &str, updated_at: &str) -> bool {
+    updated_at.is_empty() || timestamp.is_empty() || timestamp > updated_at
+}
+
 /// Inputs to a single thread-memory merge.
 ///
 /// `persona_memory` is the cross-thread persona memory used to color the
@@ -399,6 +405,14 @@ mod tests {
         let got = filter_new_messages(&missing, "2026-04-05T00:00:00.000000Z");
         assert_eq!(got.len(), 2);
         assert!(got.iter().any(|m| m.content == "no ts"));
+
+        // The count-only rule agrees with the filter.
+        let cutoff = "2026-04-05T00:00:00.000000Z";
+        let counted = missing
+            .iter()
+            .filter(|m| is_new_since(&m.timestamp, cutoff))
+            .count();
+        assert_eq!(counted, got.len());
     }
 
     #[test]
@@ -1,7 +1,11 @@
 //! Tera filter + helper registration, matching the Django template filters that
 //! templates rely on (`|markdown`, `|display_name`).
 
-use std::collections::HashMap;
+use std::{
+    collections::{BTreeMap, HashMap},
+    hash::{BuildHasher, RandomState},
+    sync::{LazyLock, Mutex as StdMutex},
+};
 
 use pulldown_cmark::{Options, Parser, html};
 use serde_json::Value;
@@ -14,11 +18,107 @@ pub fn register(tera: &mut Tera) {
     tera.register_filter("escapejs", escapejs_filter);
 }
 
+/// Rendered HTML for recently seen markdown. A chat view re-renders every
+/// assistant message in the thread on each load, but only the newest one is
+/// new; the rest hit here instead of going back through the parser.
+static MARKDOWN_CACHE: LazyLock<StdMutex<MarkdownCache>> =
+    LazyLock::new(|| StdMutex::new(MarkdownCache::new(MARKDOWN_CACHE_BUDGET)));
+
+/// Bytes of rendered HTML kept before least-recently-used entries are
+/// evicted. Several long threads' worth, regardless of how many messages
+/// that is.
+const MARKDOWN_CACHE_BUDGET: usize = 8 * 1024 * 1024;
+
+/// Two differently keyed source hashes + length. The source itself isn't
+/// kept, so a long message costs its HTML once, not twice; 128 bits of
+/// per-process keyed hash stand in for comparing it on a hit.
+type MarkdownKey = (u64, u64, usize);
+
+/// Randomly seeded once per process, so colliding messages can't be
+/// precomputed from chat content.
+static KEY_HASHERS: LazyLock<(RandomState, RandomState)> =
+    LazyLock::new(|| (RandomState::new(), RandomState::new()));
+
+fn markdown_key(input: &str) -> MarkdownKey {
+    let (a, b) = &*KEY_HASHERS;
+    (a.hash_one(input), b.hash_one(input), input.len())
+}
+
+/// Byte-budgeted LRU. `order` maps each entry's last-use tick back to its
+/// key, so the oldest entry is always `order`'s first.
+struct MarkdownCache {
+    entries: HashMap<MarkdownKey, (String, u64)>,
+    order: BTreeMap<u64, MarkdownKey>,
+    tick: u64,
+    bytes: usize,
+    budget: usize,
+}
+
+impl MarkdownCache {
+    fn new(budget: usize) -> Self {
+        Self {
+            entries: HashMap::new(),
+            order: BTreeMap::new(),
+            tick: 0,
+            bytes: 0,
+            budget,
+        }
+    }
+
+    fn get(&mut self, key: MarkdownKey) -> Option<String> {
+        self.tick += 1;
+        let (html, last_used) = self.entries.get_mut(&key)?;
+        self.order.remove(last_used);
+        *last_used = self.tick;
+        self.order.insert(self.tick, key);
+        Some(html.clone())
+    }
+
+    fn insert(&mut self, key: MarkdownKey, html: String) {
+        // One entry bigger than the whole budget would just flush everything
+        // else on its way through.
+        if html.len() > self.budget {
+            return;
+        }
+        self.tick += 1;
+        self.bytes += html.len();
+        if let Some((old, last_used)) = self.entries.insert(key, (html, self.tick)) {
+            self.bytes -= old.len();
+            self.order.remove(&last_used);
+        }
+        self.order.insert(self.tick, key);
+        while self.bytes > self.budget
+            && let Some((_, oldest)) = self.order.pop_first()
+        {
+            if let Some((html, _)) = self.entries.remove(&oldest) {
+                self.bytes -= html.len();
+            }
+        }
+    }
+}
+
 fn markdown_filter(value: &Value, _args: &HashMap<String, Value>) -> Result<Value> {
     let input = value
         .as_str()
         .ok_or_else(|| tera::Error::msg("markdown filter expects a string"))?;
 
+    let key = markdown_key(input);
+    if let Some(html) = MARKDOWN_CACHE
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .get(key)
+    {
+        return Ok(Value::String(html));
+    }
+    let out = render_markdown(input);
+    MARKDOWN_CACHE
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .insert(key, out.clone());
+    Ok(Value::String(out))
+}
+
+fn render_markdown(input: &str) -> String {
     let mut options = Options::empty();
     options.insert(Options::ENABLE_TABLES);
     options.insert(Options::ENABLE_STRIKETHROUGH);
@@ -28,7 +128,7 @@ fn markdown_filter(value: &Value, _args: &HashMap<String, Value>) -> Result<Valu
     let parser = Parser::new_ext(input, options);
     let mut out = String::with_capacity(input.len() + input.len() / 4);
     html::push_html(&mut out, parser);
-    Ok(Value::String(out))
+    out
 }
 
 /// `"assistant_role"` → `"Assistant Role"`. Matches the Django `display_name`
@@ -99,6 +199,42 @@ mod tests {
         assert!(out.contains("<em>italic</em>"));
     }
 
+    #[test]
+    fn markdown_repeat_render_matches() {
+        let md = "# Heading\n\n- one\n- two";
+        let first = apply(markdown_filter, json!(md));
+        assert_eq!(apply(markdown_filter, json!(md)), first);
+        assert_eq!(first, render_markdown(md));
+    }
+
+    #[test]
+    fn markdown_cache_evicts_least_recently_used_within_budget() {
+        let mut cache = MarkdownCache::new(10);
+        cache.insert(markdown_key("a"), "aaaa".into());
+        cache.insert(markdown_key("b"), "bbbb".into());
+        // Touch "a" so "b" is the oldest when "c" pushes past the budget.
+        assert_eq!(cache.get(markdown_key("a")).as_deref(), Some("aaaa"));
+        cache.insert(markdown_key("c"), "cccc".into());
+        assert!(cache.get(markdown_key("b")).is_none());
+        assert!(cache.get(markdown_key("a")).is_some());
+        assert!(cache.get(markdown_key("c")).is_some());
+        assert_eq!(cache.bytes, 8);
+
+        // Oversized entries are rendered but never cached.
+        cache.insert(markdown_key("huge"), "x".repeat(11));
+        assert!(cache.get(markdown_key("huge")).is_none());
+        assert_eq!(cache.bytes, 8);
+    }
+
+    #[test]
+    fn markdown_cache_replacing_an_entry_keeps_the_byte_count() {
+        let mut cache = MarkdownCache::new(100);
+        cache.insert(markdown_key("a"), "12345".into());
+        cache.insert(markdown_key("a"), "123".into());
+        assert_eq!(cache.bytes, 3);
+        assert_eq!(cache.entries.len(), cache.order.len());
+    }
+
     #[test]
     fn markdown_tables() {
         let md = "| a | b |\n|---|---|\n| 1 | 2 |";
@@ -1076,7 +1076,8 @@ function contextFilesModal() {
 
             if (response.ok) {
                 const data = await response.json();
-                this.files = data.files;
+                const entry = this.files.find(f => f.name === data.file.name);
+                if (entry) entry.enabled = data.file.enabled;
                 this._syncFilesToSource();
                 this.updateBadge();
             }
@@ -1102,7 +1103,7 @@ function contextFilesModal() {
 
             if (response.ok) {
                 const data = await response.json();
-                this.files = data.files;
+                this.files = this.files.filter(f => f.name !== data.deleted);
                 this._syncFilesToSource();
                 this.showStatus(`Deleted ${filename}`, 'success');
                 this.updateBadge();
@@ -1068,15 +1068,16 @@ function saveDraftNow() {
 }
 
 /**
- * Clear draft on server (cancel any pending debounced save, then save empty).
- * Call this on form submit.
+ * Drop any pending debounced draft save. Call this after a message is sent —
+ * /chat/send/ clears the server-side draft itself (in the same write that
+ * stores the message, or on its own if the LLM call fails), so there's
+ * nothing else to post.
  */
 function clearDraft() {
     if (draftSaveTimer) {
         clearTimeout(draftSaveTimer);
         draftSaveTimer = null;
     }
-    saveDraftNow();
 }
 
 /**
@@ -5,7 +5,9 @@
 
 use std::path::Path;
 
-use liminal_salt::services::chat::{ChatError, SendContext, send_message};
+use liminal_salt::services::chat::{
+    ChatError, SendContext, send_message, send_message_with_session,
+};
 use liminal_salt::services::llm::{ChatLlm, LlmError, LlmMessage};
 use liminal_salt::services::session::{self, Mode, Role};
 
@@ -35,6 +37,8 @@ fn ctx<'a>(sessions_dir: &'a Path, session_id: &'a str, system_prompt: &'a str)
         user_timezone: "UTC",
         assistant_timezone: None,
         context_history_limit: 50,
+        auto_title: false,
+        clear_draft: false,
     }
 }
 
@@ -75,7 +79,7 @@ async fn send_preserves_scenario_memory_pinned_draft() {
     )
     .await;
 
-    assert_eq!(outcome.unwrap(), "The gate creaks open.");
+    assert_eq!(outcome.unwrap().reply, "The gate creaks open.");
 
     let loaded = session::load_session(tmp.path(), id).await.unwrap();
     assert_eq!(loaded.scenario.as_deref(), Some("ominous clearing at dusk"));
@@ -92,11 +96,111 @@ async fn send_preserves_scenario_memory_pinned_draft() {
     assert_eq!(loaded.messages[1].role, Role::Assistant);
     assert_eq!(loaded.messages[1].content, "The gate creaks open.");
 
-    // send_message must not lock the title — summarizer will do that in a
-    // separate step.
+    // auto_title off: send_message must not touch the title.
     assert!(loaded.title_locked.is_none());
 }
 
+#[tokio::test]
+async fn auto_title_saves_and_locks_title() {
+    let tmp = tempfile::tempdir().unwrap();
+    let id = "session_20260421_130005.json";
+    session::create_session(tmp.path(), id, "assistant", "New Chat", Mode::Chatbot, vec![])
+        .await
+        .unwrap();
+
+    let llm = FakeLlm {
+        response: "Garden Planning Tips".to_string(),
+    };
+    let mut send_ctx = ctx(tmp.path(), id, "sys");
+    send_ctx.auto_title = true;
+    let outcome = send_message(&send_ctx, &llm, "how do I plan a garden?", false)
+        .await
+        .unwrap();
+    assert_eq!(outcome.title.as_deref(), Some("Garden Planning Tips"));
+
+    let loaded = session::load_session(tmp.path(), id).await.unwrap();
+    assert_eq!(loaded.title, "Garden Planning Tips");
+    assert_eq!(loaded.title_locked, Some(true));
+    assert_eq!(loaded.messages.len(), 2);
+
+    // Locked now — a second turn leaves the title alone.
+    let again = send_message(&send_ctx, &llm, "and in winter?", false)
+        .await
+        .unwrap();
+    assert!(again.title.is_none());
+}
+
+/// Renames the session while "thinking" on the first call, like a user
+/// editing the title mid-turn; every later call (the title request) answers
+/// with a generated title.
+struct RenamingLlm<'a> {
+    sessions_dir: &'a Path,
+    session_id: &'a str,
+    calls: std::sync::atomic::AtomicUsize,
+}
+
+impl ChatLlm for RenamingLlm<'_> {
+    async fn complete(&self, _messages: &[LlmMessage]) -> Result<String, LlmError> {
+        if self.calls.fetch_add(1, std::sync::atomic::Ordering::SeqCst) == 0 {
+            session::rename_session(self.sessions_dir, self.session_id, "My Own Title")
+                .await
+                .unwrap();
+            return Ok("reply".to_string());
+        }
+        Ok("Generated Title".to_string())
+    }
+}
+
+#[tokio::test]
+async fn rename_during_turn_survives_reply_save_and_auto_title() {
+    let tmp = tempfile::tempdir().unwrap();
+    let id = "session_20260421_130013.json";
+    session::create_session(tmp.path(), id, "assistant", "New Chat", Mode::Chatbot, vec![])
+        .await
+        .unwrap();
+
+    let llm = RenamingLlm {
+        sessions_dir: tmp.path(),
+        session_id: id,
+        calls: Default::default(),
+    };
+    let mut send_ctx = ctx(tmp.path(), id, "sys");
+    send_ctx.auto_title = true;
+    let outcome = send_message(&send_ctx, &llm, "hello", false).await.unwrap();
+    assert_eq!(outcome.reply, "reply");
+    assert!(outcome.title.is_none(), "rename locked the title first");
+
+    let loaded = session::load_session(tmp.path(), id).await.unwrap();
+    assert_eq!(loaded.title, "My Own Title");
+    assert_eq!(loaded.title_locked, Some(true));
+    assert_eq!(loaded.messages.len(), 2, "reply is saved regardless");
+}
+
+#[tokio::test]
+async fn clear_draft_empties_draft_in_the_same_save() {
+    let tmp = tempfile::tempdir().unwrap();
+    let id = "session_20260421_130006.json";
+    session::create_session(tmp.path(), id, "assistant", "t", Mode::Chatbot, vec![])
+        .await
+        .unwrap();
+    session::save_draft(tmp.path(), id, "hello the")
+        .await
+        .unwrap();
+
+    let mut send_ctx = ctx(tmp.path(), id, "sys");
+    send_ctx.clear_draft = true;
+    let llm = FakeLlm {
+        response: "hi".to_string(),
+    };
+    send_message(&send_ctx, &llm, "hello there", false)
+        .await
+        .unwrap();
+
+    let loaded = session::load_session(tmp.path(), id).await.unwrap();
+    assert_eq!(loaded.draft.as_deref(), Some(""));
+    assert_eq!(loaded.messages.len(), 2);
+}
+
 #[tokio::test]
 async fn skip_user_save_does_not_duplicate_message() {
     let tmp = tempfile::tempdir().unwrap();
@@ -138,13 +242,11 @@ async fn llm_failure_surfaces_as_llm_failed_error() {
         .await
         .unwrap();
 
-    let outcome = send_message(
-        &ctx(tmp.path(), id, "sys"),
-        &FailingLlm,
-        "hello",
-        false,
-    )
-    .await;
+    session::save_draft(tmp.path(), id, "hello").await.unwrap();
+
+    let mut send_ctx = ctx(tmp.path(), id, "sys");
+    send_ctx.clear_draft = true;
+    let outcome = send_message(&send_ctx, &FailingLlm, "hello", false).await;
     match outcome {
         Err(ChatError::LlmFailed(_)) => {}
         other => panic!("expected LlmFailed, got {other:?}"),
@@ -157,6 +259,8 @@ async fn llm_failure_surfaces_as_llm_failed_error() {
         loaded.messages.is_empty(),
         "failed turn must not leave partial state on disk",
     );
+    // ...but the sent draft is gone, matching the client's emptied composer.
+    assert_eq!(loaded.draft.as_deref(), Some(""));
 }
 
 #[tokio::test]
@@ -179,3 +283,28 @@ async fn missing_session_returns_session_not_found() {
         other => panic!("expected SessionNotFound, got {other:?}"),
     }
 }
+
+#[tokio::test]
+async fn preloaded_send_keeps_fields_changed_after_load() {
+    let tmp = tempfile::tempdir().unwrap();
+    let id = "session_20260421_130011.json";
+    session::create_session(tmp.path(), id, "assistant", "New Chat", Mode::Chatbot, vec![])
+        .await
+        .unwrap();
+
+    let preloaded = session::load_session(tmp.path(), id).await.unwrap();
+    // Written after the caller's load — the save's RMW must keep it.
+    session::toggle_pin(tmp.path(), id).await.unwrap();
+
+    let llm = FakeLlm {
+        response: "hi".to_string(),
+    };
+    let outcome =
+        send_message_with_session(&ctx(tmp.path(), id, "sys"), &llm, preloaded, "hello", false)
+            .await;
+    assert_eq!(outcome.unwrap().reply, "hi");
+
+    let loaded = session::load_session(tmp.path(), id).await.unwrap();
+    assert_eq!(loaded.messages.len(), 2);
+    assert_eq!(loaded.pinned, Some(true));
+}
@@ -86,6 +86,44 @@ async fn save_then_get_round_trips() {
     assert_eq!(got, "hello\nworld");
 }
 
+#[tokio::test]
+async fn memory_with_mtime_reads_content_and_timestamp_together() {
+    let tmp = tempfile::tempdir().unwrap();
+    let (content, mtime) = memory::get_memory_with_mtime_secs(tmp.path(), "assistant").await;
+    assert!(content.is_empty());
+    assert!(mtime.is_none());
+
+    memory::save_memory_content(tmp.path(), "assistant", "notes")
+        .await
+        .unwrap();
+    let (content, mtime) = memory::get_memory_with_mtime_secs(tmp.path(), "assistant").await;
+    assert_eq!(content, "notes");
+    let expected = memory::get_mtime(tmp.path(), "assistant")
+        .await
+        .unwrap()
+        .duration_since(std::time::UNIX_EPOCH)
+        .unwrap()
+        .as_secs();
+    assert_eq!(mtime, Some(expected));
+}
+
+#[tokio::test]
+async fn memory_file_stamp_tracks_the_file_itself() {
+    let tmp = tempfile::tempdir().unwrap();
+    assert!(memory::file_stamp(tmp.path(), "assistant").await.is_none());
+    assert!(memory::file_stamp(tmp.path(), "../escape").await.is_none());
+
+    memory::save_memory_content(tmp.path(), "assistant", "notes")
+        .await
+        .unwrap();
+    let first = memory::file_stamp(tmp.path(), "assistant").await;
+    assert!(first.is_some());
+    memory::save_memory_content(tmp.path(), "assistant", "longer notes")
+        .await
+        .unwrap();
+    assert_ne!(memory::file_stamp(tmp.path(), "assistant").await, first);
+}
+
 #[tokio::test]
 async fn invalid_persona_name_rejected_at_every_entry() {
     let tmp = tempfile::tempdir().unwrap();
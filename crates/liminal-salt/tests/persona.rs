@@ -3,9 +3,9 @@
 
 use liminal_salt::services::{
     persona::{
-        self, PersonaConfig, ThreadMemoryDefaults, create_persona, delete_persona, list_personas,
-        load_identity, load_persona_config, rename_persona, save_persona_config,
-        valid_persona_name,
+        self, PersonaConfig, ThreadMemoryDefaults, create_persona, delete_persona, get_preview,
+        list_personas, load_identity, load_persona_config, rename_persona, save_identity,
+        save_persona_config, scan_personas, valid_persona_name,
     },
     session::{self, Mode},
 };
@@ -18,6 +18,9 @@ fn name_validation() {
     assert!(!valid_persona_name("with space"));
     assert!(!valid_persona_name("../escape"));
     assert!(!valid_persona_name("dash-ok")); // hyphens rejected — matches Python
+    assert!(valid_persona_name(&"a".repeat(64)));
+    assert!(!valid_persona_name(&"a".repeat(65)));
+    assert!(!valid_persona_name("café")); // non-ASCII letters rejected
 }
 
 #[tokio::test]
@@ -44,6 +47,40 @@ async fn create_rejects_duplicate() {
     assert!(matches!(err, Err(persona::PersonaError::AlreadyExists)));
 }
 
+#[tokio::test]
+async fn preview_reflects_identity_edits() {
+    let tmp = tempfile::tempdir().unwrap();
+    create_persona(tmp.path(), "scribe", "first draft").await.unwrap();
+    assert_eq!(get_preview(tmp.path(), "scribe").await, "first draft");
+    // Served from cache on repeat; a save changes the file's len/mtime and
+    // must be picked up.
+    assert_eq!(get_preview(tmp.path(), "scribe").await, "first draft");
+    assert!(save_identity(tmp.path(), "scribe", "second, longer draft").await);
+    assert_eq!(get_preview(tmp.path(), "scribe").await, "second, longer draft");
+}
+
+#[tokio::test]
+async fn scan_maps_personas_to_first_identity_file() {
+    let tmp = tempfile::tempdir().unwrap();
+    create_persona(tmp.path(), "alpha", "identity").await.unwrap();
+    let dir = persona::persona_dir(tmp.path(), "alpha");
+    std::fs::write(dir.join("aaa_notes.md"), "notes").unwrap();
+    // A folder without markdown isn't a persona.
+    std::fs::create_dir_all(persona::persona_dir(tmp.path(), "empty")).unwrap();
+
+    let scanned = scan_personas(tmp.path()).await;
+    assert_eq!(scanned.keys().collect::<Vec<_>>(), ["alpha"]);
+    assert_eq!(scanned["alpha"], dir.join("aaa_notes.md"));
+    assert_eq!(persona::read_preview(&scanned["alpha"]).await, "notes");
+}
+
+#[tokio::test]
+async fn delete_missing_persona_is_not_found() {
+    let tmp = tempfile::tempdir().unwrap();
+    let err = delete_persona(tmp.path(), "ghost").await;
+    assert!(matches!(err, Err(persona::PersonaError::NotFound)));
+}
+
 #[tokio::test]
 async fn delete_cascades_memory_and_context() {
     let tmp = tempfile::tempdir().unwrap();
@@ -227,3 +264,11 @@ async fn rename_rejects_target_collision() {
     let err = rename_persona(tmp.path(), "one", "two").await;
     assert!(matches!(err, Err(persona::PersonaError::AlreadyExists)));
 }
+
+#[tokio::test]
+async fn rename_missing_persona_is_not_found() {
+    let tmp = tempfile::tempdir().unwrap();
+    create_persona(tmp.path(), "present", "body").await.unwrap();
+    let err = rename_persona(tmp.path(), "absent", "fresh").await;
+    assert!(matches!(err, Err(persona::PersonaError::NotFound)));
+}
@@ -157,3 +157,19 @@ async fn empty_scenario_is_not_emitted_in_roleplay() {
     let prompt = build_system_prompt(tmp.path(), &session).await;
     assert!(!prompt.contains("--- SCENARIO ---"));
 }
+
+#[tokio::test]
+async fn edited_identity_is_picked_up_on_next_build() {
+    let tmp = tempfile::tempdir().unwrap();
+    seed_persona(tmp.path(), "sage", "Answers briefly.").await;
+    let session = blank_session("sage", Mode::Chatbot);
+
+    let first = build_system_prompt(tmp.path(), &session).await;
+    assert!(first.contains("Answers briefly."));
+    assert_eq!(build_system_prompt(tmp.path(), &session).await, first);
+
+    assert!(persona::save_identity(tmp.path(), "sage", "Answers at great length.").await);
+    let second = build_system_prompt(tmp.path(), &session).await;
+    assert!(second.contains("Answers at great length."));
+    assert!(!second.contains("Answers briefly."));
+}
@@ -36,6 +36,40 @@ async fn valid_session_id_rejects_traversal_and_garbage() {
     assert!(!valid_session_id("session_abc.json"));
 }
 
+#[tokio::test]
+async fn generate_session_id_never_repeats_and_sorts_in_issue_order() {
+    let tmp = tempfile::tempdir().unwrap();
+    let mut ids = Vec::new();
+    for _ in 0..12 {
+        ids.push(session::generate_session_id(tmp.path()).await);
+    }
+    for id in &ids {
+        assert!(valid_session_id(id), "{id} should be a valid id");
+    }
+    let mut sorted = ids.clone();
+    sorted.sort();
+    sorted.dedup();
+    assert_eq!(sorted, ids, "zero-padded suffixes keep filename order = issue order");
+}
+
+#[tokio::test]
+async fn generate_session_id_skips_ids_already_on_disk() {
+    let tmp = tempfile::tempdir().unwrap();
+    // Files a previous run could have left for this second and the next one.
+    let now = chrono::Utc::now();
+    for at in [now, now + chrono::Duration::seconds(1)] {
+        let stamp = at.format("%Y%m%d_%H%M%S");
+        std::fs::write(tmp.path().join(format!("session_{stamp}.json")), "{}").unwrap();
+        for seq in 1..=20 {
+            std::fs::write(tmp.path().join(format!("session_{stamp}_{seq:03}.json")), "{}")
+                .unwrap();
+        }
+    }
+    let id = session::generate_session_id(tmp.path()).await;
+    assert!(valid_session_id(&id));
+    assert!(!tmp.path().join(&id).exists(), "{id} is already taken");
+}
+
 #[tokio::test]
 async fn create_then_load_round_trips_core_fields() {
     let tmp = tempfile::tempdir().unwrap();
@@ -115,6 +149,7 @@ async fn save_chat_history_preserves_non_chat_fields() {
         "assistant",
         messages.clone(),
         Some(true),
+        false,
     )
     .await
     .unwrap();
@@ -148,7 +183,7 @@ async fn invalid_session_id_short_circuits_every_writer() {
         session::create_session(tmp.path(), bogus, "x", "x", Mode::Chatbot, vec![]).await,
     );
     assert_invalid(session::delete_session(tmp.path(), bogus).await);
-    assert_invalid(session::save_chat_history(tmp.path(), bogus, "t", "p", vec![], None).await);
+    assert_invalid(session::save_chat_history(tmp.path(), bogus, "t", "p", vec![], None, false).await);
     assert_invalid(session::toggle_pin(tmp.path(), bogus).await);
     assert_invalid(session::rename_session(tmp.path(), bogus, "new").await);
     assert_invalid(session::save_draft(tmp.path(), bogus, "x").await);
@@ -381,6 +416,33 @@ async fn update_persona_across_sessions_rewrites_matching_sessions() {
     );
 }
 
+#[tokio::test]
+async fn update_persona_across_sessions_ignores_name_lookalikes() {
+    let tmp = tempfile::tempdir().unwrap();
+    let a = "session_20260421_120021.json";
+    let b = "session_20260421_120022.json";
+    // Persona name appears as the title — passes the byte prefilter but the
+    // persona field itself doesn't match.
+    session::create_session(tmp.path(), a, "other", "sage", Mode::Chatbot, vec![])
+        .await
+        .unwrap();
+    // Longer name sharing the prefix.
+    session::create_session(tmp.path(), b, "sage2", "t", Mode::Chatbot, vec![])
+        .await
+        .unwrap();
+
+    session::update_persona_across_sessions(tmp.path(), "sage", "oracle").await;
+
+    assert_eq!(
+        session::load_session(tmp.path(), a).await.unwrap().persona,
+        "other"
+    );
+    assert_eq!(
+        session::load_session(tmp.path(), b).await.unwrap().persona,
+        "sage2"
+    );
+}
+
 #[tokio::test]
 async fn concurrent_save_chat_history_produces_valid_json() {
     use tokio::task::JoinSet;
@@ -403,7 +465,7 @@ async fn concurrent_save_chat_history_produces_valid_json() {
                     timestamp: session::now_timestamp(),
                 })
                 .collect();
-            session::save_chat_history(&path, &id, &format!("title {i}"), "assistant", messages, None)
+            session::save_chat_history(&path, &id, &format!("title {i}"), "assistant", messages, None, false)
                 .await
         });
     }
@@ -452,6 +514,52 @@ async fn list_sessions_sorts_newest_first_and_skips_non_json() {
     assert_eq!(list[1].id, "session_20260421_120015.json");
 }
 
+#[tokio::test]
+async fn list_sessions_reflects_renames_pins_and_deletes() {
+    let tmp = tempfile::tempdir().unwrap();
+    let a = "session_20260421_120031.json";
+    let b = "session_20260421_120032.json";
+    for id in [a, b] {
+        session::create_session(tmp.path(), id, "sage", "New Chat", Mode::Chatbot, vec![])
+            .await
+            .unwrap();
+    }
+    assert_eq!(session::list_sessions(tmp.path()).await.len(), 2);
+
+    // Repeat listings are served from the summary cache; every write must
+    // still show up on the next one.
+    session::rename_session(tmp.path(), a, "Garden plans").await.unwrap();
+    session::toggle_pin(tmp.path(), b).await.unwrap();
+    let list = session::list_sessions(tmp.path()).await;
+    let renamed = list.iter().find(|s| s.id == a).unwrap();
+    assert_eq!(renamed.title, "Garden plans");
+    assert!(list.iter().find(|s| s.id == b).unwrap().pinned);
+
+    session::delete_session(tmp.path(), b).await.unwrap();
+    let list = session::list_sessions(tmp.path()).await;
+    assert_eq!(list.len(), 1);
+    assert_eq!(list[0].id, a);
+}
+
+#[tokio::test]
+async fn list_sessions_sees_in_place_rewrites_when_the_dir_mtime_holds() {
+    let tmp = tempfile::tempdir().unwrap();
+    let id = "session_20260421_120041.json";
+    session::create_session(tmp.path(), id, "sage", "New Chat", Mode::Chatbot, vec![])
+        .await
+        .unwrap();
+
+    let old = std::time::SystemTime::now() - std::time::Duration::from_secs(60);
+    std::fs::File::open(tmp.path()).unwrap().set_modified(old).unwrap();
+    assert_eq!(session::list_sessions(tmp.path()).await[0].title, "New Chat");
+
+    // Rewrite the file, then put the directory mtime back as a coarse
+    // filesystem clock (or an external edit) would leave it.
+    session::rename_session(tmp.path(), id, "Renamed").await.unwrap();
+    std::fs::File::open(tmp.path()).unwrap().set_modified(old).unwrap();
+    assert_eq!(session::list_sessions(tmp.path()).await[0].title, "Renamed");
+}
+
 // =============================================================================
 // list_persona_threads
 // =============================================================================
@@ -511,6 +619,22 @@ async fn list_persona_threads_filters_persona_and_skips_roleplay() {
     assert_eq!(threads[0].messages[0].content, "match");
 }
 
+#[tokio::test]
+async fn list_persona_threads_sees_persona_changes_after_listing() {
+    let tmp = tempfile::tempdir().unwrap();
+    let id = "session_20260421_180001.json";
+    seed_session(tmp.path(), id, "before", Mode::Chatbot, vec![msg(Role::User, "hi")]).await;
+
+    // Warm the sidebar cache with the old persona, then move the thread.
+    assert_eq!(session::list_sessions(tmp.path()).await[0].persona, "before");
+    session::update_persona_across_sessions(tmp.path(), "before", "after").await;
+
+    assert!(session::list_persona_threads(tmp.path(), "before", None, None).await.is_empty());
+    let threads = session::list_persona_threads(tmp.path(), "after", None, None).await;
+    assert_eq!(threads.len(), 1);
+    assert_eq!(threads[0].messages[0].content, "hi");
+}
+
 #[tokio::test]
 async fn list_persona_threads_respects_per_thread_message_cap() {
     let tmp = tempfile::tempdir().unwrap();
@@ -568,3 +692,38 @@ async fn list_persona_threads_missing_dir_returns_empty() {
     let threads = session::list_persona_threads(&nonexistent, "r", None, None).await;
     assert!(threads.is_empty());
 }
+
+#[tokio::test]
+async fn load_thread_memory_matches_full_session() {
+    let tmp = tempfile::tempdir().unwrap();
+    let id = "session_20260421_170000.json";
+    let history = vec![msg(Role::User, "hello"), msg(Role::Assistant, "hi")];
+    session::create_session(tmp.path(), id, "assistant", "New Chat", Mode::Chatbot, history)
+        .await
+        .unwrap();
+
+    // Absent fields read back as empty, like `load_session`'s defaults.
+    let (memory, updated_at) = session::load_thread_memory(tmp.path(), id).await.unwrap();
+    assert!(memory.is_empty() && updated_at.is_empty());
+
+    session::save_thread_memory(tmp.path(), id, "notes", "2026-04-21T16:00:01.000000Z")
+        .await
+        .unwrap();
+    let full = session::load_session(tmp.path(), id).await.unwrap();
+    let (memory, updated_at) = session::load_thread_memory(tmp.path(), id).await.unwrap();
+    assert_eq!(memory, full.thread_memory);
+    assert_eq!(updated_at, full.thread_memory_updated_at);
+
+    assert!(matches!(
+        session::load_thread_memory(tmp.path(), "session_20260421_170001.json").await,
+        Err(SessionError::NotFound(_))
+    ));
+}
+
+#[tokio::test]
+async fn list_sessions_missing_dir_returns_empty_without_creating_it() {
+    let tmp = tempfile::tempdir().unwrap();
+    let nonexistent = tmp.path().join("never_created");
+    assert!(session::list_sessions(&nonexistent).await.is_empty());
+    assert!(!nonexistent.exists());
+}
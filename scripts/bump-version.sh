@@ -76,32 +76,56 @@ echo "bumping $current -> $new"
 # Cargo.toml: line 3 is the package version under the [package] stanza.
 sed -i '' "3s/^version = .*/version = \"$new\"/" "$CARGO_TOML"
 
-# package.json: rewrite the first "version" field (top-level).
-sed -i '' "1,/\"version\":/ s/\"version\": \"[^\"]*\"/\"version\": \"$new\"/" "$PACKAGE_JSON"
+# package.json: rewrite the first "version" field (top-level) in place,
+# keeping the file's own spacing, and refuse to continue if nothing matched
+# rather than leaving it silently out of sync.
+sed -i '' "1,/\"version\"[[:space:]]*:/ s/\(\"version\"[[:space:]]*:[[:space:]]*\"\)[^\"]*\"/\1$new\"/" "$PACKAGE_JSON"
+if ! grep -q "\"version\"[[:space:]]*:[[:space:]]*\"$new\"" "$PACKAGE_JSON"; then
+    echo "could not update the version in $PACKAGE_JSON" >&2
+    exit 1
+fi
 
 # README.md: the **vX.Y.Z** banner near the top.
 sed -i '' "s/\*\*v[0-9][^*]*\*\*/\*\*v$new\*\*/" "$README"
 
 # Prepend a CHANGELOG entry. Include every commit since the most recent
 # v* tag, minus prior bump commits. If no tag exists, include everything.
+# git log's output streams straight into the new file rather than being held
+# in a shell variable first; awk drops prior bump commits by subject and
+# supplies the placeholder line when nothing is left.
 last_tag=$(git describe --tags --abbrev=0 --match='v*' 2>/dev/null || true)
-if [[ -n "$last_tag" ]]; then
-    commits=$(git log "$last_tag"..HEAD --pretty=format:'- %s' | grep -v '^- Bump version to ' || true)
-else
-    commits=$(git log --pretty=format:'- %s' | grep -v '^- Bump version to ' || true)
-fi
-if [[ -z "$commits" ]]; then
-    commits="- (no commits since ${last_tag:-HEAD})"
-fi
+range="${last_tag:+$last_tag..}HEAD"
 
+# The existing entries are streamed through after the new one, never read
+# into memory. Only the first line is checked for the `# Changelog` header;
+# without it, the whole file is kept below a fresh header. The temp file sits
+# next to CHANGELOG.md so the final mv is a same-filesystem rename, and is
+# removed if anything fails before that rename.
 today=$(date +%Y-%m-%d)
-tmp=$(mktemp)
+IFS= read -r first_line < "$CHANGELOG" || true
+if [[ "$first_line" == "# Changelog" ]]; then
+    keep_from=3
+else
+    keep_from=1
+fi
+tmp=$(mktemp "$CHANGELOG.XXXXXX")
+trap 'rm -f "$tmp"' EXIT
 {
-    head -n 1 "$CHANGELOG"
-    printf '\n## [%s] - %s\n\n### Changes\n%s\n\n' "$new" "$today" "$commits"
-    tail -n +3 "$CHANGELOG"
+    printf '# Changelog\n\n## [%s] - %s\n\n### Changes\n' "$new" "$today"
+    git log "$range" --pretty=tformat:'- %s' |
+        awk -v since="${last_tag:-HEAD}" '
+            /^- Bump version to / { next }
+            { print; n++ }
+            END { if (!n) print "- (no commits since " since ")" }
+        '
+    printf '\n'
+    tail -n +"$keep_from" "$CHANGELOG"
 } > "$tmp"
+# mktemp creates 0600; keep the changelog world-readable like the rest of
+# the tree.
+chmod 644 "$tmp"
 mv "$tmp" "$CHANGELOG"
+trap - EXIT
 
 # Refresh Cargo.lock so the new crate version lands there too.
 cargo build -p liminal-salt >/dev/null 2>&1 || true